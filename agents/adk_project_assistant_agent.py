@@ -7,14 +7,223 @@ arkaft-mcp-google-adk MCP server tools for project setup, architectural guidance
 code examples, troubleshooting, and task breakdown.
 """
 
+import io
 import json
+import re
+import string
+import sys
 import asyncio
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass
+import copy
+import dataclasses
+import functools
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Any, Union, Tuple, Sequence
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 
 
+_RESOURCES_DIR = Path(__file__).parent / "resources"
+
+# dataclass(slots=True) is only available on Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Maximum number of assistance results kept per agent
+_RESULT_CACHE_SIZE = 128
+
+
+# Static templates shared by every request (immutable, so never copied per call)
+_TASK_PREREQS = (
+    "ADK development environment set up",
+    "Basic understanding of Rust and ADK concepts",
+    "Project structure in place"
+)
+
+_TASK_VALIDATION = (
+    "Each component compiles without errors",
+    "Unit tests pass for all components",
+    "Integration tests validate component interaction",
+    "Code follows ADK best practices",
+    "Documentation is complete and accurate"
+)
+
+_TASK_SUCCESS = (
+    "All functionality works as specified",
+    "Code quality meets project standards",
+    "Performance requirements are met",
+    "Error handling is comprehensive",
+    "Documentation is complete"
+)
+
+_DEFAULT_RESOURCES = tuple(map(sys.intern, (
+    "Official Google ADK Documentation",
+    "ADK Best Practices Guide",
+    "ADK Community Forums",
+    "ADK GitHub Repository"
+)))
+
+_DEFAULT_BEST_PRACTICES = tuple(map(sys.intern, (
+    "Follow ADK architectural patterns",
+    "Implement proper error handling",
+    "Use structured logging and monitoring",
+    "Write comprehensive tests",
+    "Document your code and APIs"
+)))
+
+_DEFAULT_REFERENCES = tuple(map(sys.intern, (
+    "Google ADK Official Documentation",
+    "ADK Rust API Reference",
+    "ADK Architecture Guide"
+)))
+
+_DEFAULT_FOLLOWUP = (
+    "Review the provided guidance and examples",
+    "Start with a simple implementation",
+    "Test your implementation thoroughly",
+    "Seek feedback from the ADK community",
+    "Iterate and improve based on experience"
+)
+
+# Sample Rust sources sent to the architecture / code review tools
+_VALIDATION_TEMPLATE = string.Template("""
+// Sample ADK project structure for validation
+// Request: $user_request
+
+use adk_core::{Component, Service, Result};
+
+pub struct SampleComponent {
+    name: String,
+}
+
+impl Component for SampleComponent {
+    fn initialize(&mut self, ctx: &ComponentContext) -> Result<()> {
+        // Initialization logic
+        Ok(())
+    }
+}
+
+pub struct SampleService {
+    component: SampleComponent,
+}
+
+impl Service for SampleService {
+    async fn handle_request(&self, request: ServiceRequest) -> Result<ServiceResponse> {
+        // Service logic
+        Ok(ServiceResponse::success(()))
+    }
+}
+""")
+
+_ANALYSIS_TEMPLATE = string.Template("""
+// Sample ADK code for analysis
+// Request: $user_request
+
+use adk_core::{Component, Result, Error};
+
+pub struct ExampleComponent {
+    initialized: bool,
+}
+
+impl ExampleComponent {
+    pub fn new() -> Self {
+        Self { initialized: false }
+    }
+}
+
+impl Component for ExampleComponent {
+    fn initialize(&mut self, _ctx: &ComponentContext) -> Result<()> {
+        self.initialized = true;
+        println!("Component initialized");
+        Ok(())
+    }
+    
+    fn start(&mut self, _ctx: &ComponentContext) -> Result<()> {
+        if !self.initialized {
+            return Err(Error::NotInitialized);
+        }
+        println!("Component started");
+        Ok(())
+    }
+}
+""")
+
+_FALLBACK_TEMPLATE = string.Template("""
+# Fallback ADK Project Assistance
+
+**Your Request**: $user_request
+
+**Notice**: The MCP server is currently unavailable ($error_msg). Providing basic guidance based on general ADK knowledge.
+
+## General ADK Guidance
+
+### Getting Started
+1. **Set up Rust Development Environment**
+   - Install Rust toolchain (rustup)
+   - Set up your IDE with Rust support
+   - Install ADK CLI tools if available
+
+2. **Create ADK Project**
+   ```bash
+   cargo new my-adk-project
+   cd my-adk-project
+   ```
+
+3. **Add ADK Dependencies**
+   ```toml
+   [dependencies]
+   adk-core = "0.1"
+   adk-runtime = "0.1"
+   tokio = { version = "1.0", features = ["full"] }
+   ```
+
+### Basic ADK Patterns
+- **Components**: Implement the Component trait for reusable functionality
+- **Services**: Use the Service trait for business logic
+- **Configuration**: Use adk.toml for ADK-specific settings
+- **Error Handling**: Always use Result types for error handling
+
+### Best Practices
+- Follow Rust naming conventions
+- Implement proper error handling
+- Use async/await for I/O operations
+- Write unit and integration tests
+- Document your public APIs
+
+### Next Steps
+- Review official ADK documentation when MCP server is available
+- Start with simple component implementations
+- Join the ADK developer community
+- Practice with example projects
+
+**Recommendation**: Retry your request when the MCP server is available for comprehensive, up-to-date guidance.
+""")
+
+_FALLBACK_RESOURCES = tuple(map(sys.intern, (
+    "Official Google ADK Documentation (when available)",
+    "Rust Programming Language Book",
+    "Tokio Async Runtime Documentation"
+)))
+
+_FALLBACK_BEST_PRACTICES = tuple(map(sys.intern, (
+    "Use proper error handling",
+    "Follow Rust conventions",
+    "Implement comprehensive testing",
+    "Document your code"
+)))
+
+_FALLBACK_REFERENCES = tuple(map(sys.intern, (
+    "Manual ADK documentation review recommended",
+    "Community forums and resources"
+)))
+
+_FALLBACK_FOLLOWUP = (
+    "Retry when MCP server is available",
+    "Start with basic Rust ADK examples",
+    "Review official documentation"
+)
+
+
 class AssistanceType(Enum):
     PROJECT_SETUP = "project_setup"
     ARCHITECTURE_GUIDANCE = "architecture_guidance"
@@ -22,6 +231,45 @@ class AssistanceType(Enum):
     TROUBLESHOOTING = "troubleshooting"
     TASK_BREAKDOWN = "task_breakdown"
     GENERAL_GUIDANCE = "general_guidance"
+    
+    def __init__(self, value: str):
+        # Human-readable title, computed once per member at class creation
+        self.display = value.replace('_', ' ').title()
+
+
+# Per-type query suffixes and best-practice scenarios (pure lookups, built once)
+_ENHANCEMENT_SUFFIX = {
+    AssistanceType.PROJECT_SETUP: " - Focus on: project setup, initialization, configuration, dependencies",
+    AssistanceType.ARCHITECTURE_GUIDANCE: " - Focus on: architecture, design patterns, component organization, best practices",
+    AssistanceType.CODE_EXAMPLES: " - Focus on: code examples, implementation patterns, sample code, tutorials",
+    AssistanceType.TROUBLESHOOTING: " - Focus on: troubleshooting, error resolution, debugging, common issues",
+    AssistanceType.TASK_BREAKDOWN: " - Focus on: step-by-step guide, implementation plan, task breakdown, roadmap",
+    AssistanceType.GENERAL_GUIDANCE: " - Focus on: general guidance, best practices, recommendations"
+}
+_DEFAULT_ENHANCEMENT_SUFFIX = " - Focus on: "
+
+_SCENARIOS = {
+    AssistanceType.PROJECT_SETUP: "project_initialization",
+    AssistanceType.ARCHITECTURE_GUIDANCE: "architectural_design",
+    AssistanceType.CODE_EXAMPLES: "implementation_patterns",
+    AssistanceType.TROUBLESHOOTING: "error_handling",
+    AssistanceType.TASK_BREAKDOWN: "development_process",
+    AssistanceType.GENERAL_GUIDANCE: "general_development"
+}
+
+# Extra follow-up suggestions appended after _DEFAULT_FOLLOWUP for specific types
+_TYPE_FOLLOWUP_EXTRAS = {
+    AssistanceType.PROJECT_SETUP: (
+        "Set up your development environment",
+        "Create a simple 'Hello World' ADK application",
+        "Explore ADK component examples"
+    ),
+    AssistanceType.CODE_EXAMPLES: (
+        "Try implementing the provided examples",
+        "Modify examples to fit your use case",
+        "Create your own variations"
+    )
+}
 
 
 class Priority(Enum):
@@ -76,16 +324,65 @@ class TroubleshootingGuidance:
     related_issues: List[str]
 
 
+@dataclass(frozen=True, **_SLOTS)
+class TaskStep:
+    """A single phase of a task breakdown."""
+    phase: str
+    step: str
+    description: str
+    estimated_time: str
+    deliverables: Tuple[str, ...]
+
+
+_DEFAULT_STEPS = (
+    TaskStep(
+        phase="Planning",
+        step="1. Analyze Requirements",
+        description="Break down the task into smaller components",
+        estimated_time="15-30 minutes",
+        deliverables=("Requirements document", "Component list")
+    ),
+    TaskStep(
+        phase="Design",
+        step="2. Design Architecture",
+        description="Plan the component structure and interfaces",
+        estimated_time="30-60 minutes",
+        deliverables=("Architecture diagram", "Interface definitions")
+    ),
+    TaskStep(
+        phase="Implementation",
+        step="3. Implement Core Logic",
+        description="Write the main functionality",
+        estimated_time="1-2 hours",
+        deliverables=("Core implementation", "Unit tests")
+    ),
+    TaskStep(
+        phase="Integration",
+        step="4. Integrate Components",
+        description="Wire components together and test integration",
+        estimated_time="30-60 minutes",
+        deliverables=("Integrated system", "Integration tests")
+    ),
+    TaskStep(
+        phase="Validation",
+        step="5. Test and Validate",
+        description="Comprehensive testing and validation",
+        estimated_time="30-45 minutes",
+        deliverables=("Test results", "Validation report")
+    )
+)
+
+
 @dataclass
 class TaskBreakdown:
     """Task breakdown with step-by-step guidance."""
     task_description: str
     complexity_level: str
     estimated_time: str
-    prerequisites: List[str]
-    steps: List[Dict[str, Any]]
-    validation_points: List[str]
-    success_criteria: List[str]
+    prerequisites: Sequence[str]
+    steps: Sequence[TaskStep]
+    validation_points: Sequence[str]
+    success_criteria: Sequence[str]
 
 
 @dataclass
@@ -95,12 +392,82 @@ class ProjectAssistanceResult:
     summary: str
     primary_guidance: Union[ProjectSetupGuidance, ArchitecturalGuidance, List[CodeExample], 
                            TroubleshootingGuidance, TaskBreakdown, str]
-    additional_resources: List[str]
-    best_practices: List[str]
-    references: List[str]
+    additional_resources: Tuple[str, ...]
+    best_practices: Tuple[str, ...]
+    references: Tuple[str, ...]
     follow_up_suggestions: List[str]
 
 
+def _copy_result(result: ProjectAssistanceResult) -> ProjectAssistanceResult:
+    """Copy a cached result so callers can't mutate the cached guidance or suggestions."""
+    return dataclasses.replace(
+        result,
+        primary_guidance=copy.deepcopy(result.primary_guidance),
+        follow_up_suggestions=list(result.follow_up_suggestions)
+    )
+
+
+@dataclass(frozen=True, **_SLOTS)
+class ProjectContext:
+    """Immutable, hashable view of the project context supplied with a request."""
+    raw: str = "{}"  # Canonical JSON of the full context dict, used for hashing
+    data: Mapping[str, Any] = field(
+        default_factory=lambda: MappingProxyType({}), compare=False, hash=False, repr=False
+    )
+    
+    @classmethod
+    def from_dict(cls, context: Optional[Dict[str, Any]]) -> "ProjectContext":
+        """Build a ProjectContext from the raw context dict supplied by callers."""
+        context = context or {}
+        return cls(
+            raw=json.dumps(context, sort_keys=True, default=str),
+            data=MappingProxyType(copy.deepcopy(context))
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a fresh copy of the original context dict."""
+        return copy.deepcopy(dict(self.data))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_static_examples() -> tuple:
+    """Load the built-in code examples from the resources directory (parsed once)."""
+    with open(_RESOURCES_DIR / "code_examples.json", encoding="utf-8") as f:
+        data = json.load(f)
+    return tuple(CodeExample(**example) for example in data)
+
+
+# Keyword indicators per assistance type, checked in order: setup first for
+# specificity, task breakdown before code examples to avoid conflicts, and
+# architecture after the more specific types
+_ASSISTANCE_KEYWORDS = (
+    (AssistanceType.PROJECT_SETUP, ("setup", "set up", "create", "initialize", "start", "new project", "scaffold")),
+    (AssistanceType.TASK_BREAKDOWN, ("break down", "steps", "plan", "roadmap", "guide", "process")),
+    (AssistanceType.CODE_EXAMPLES, ("example", "code", "implement", "how to", "show me", "sample")),
+    (AssistanceType.TROUBLESHOOTING, ("error", "issue", "problem", "fix", "debug", "not working", "help")),
+    (AssistanceType.ARCHITECTURE_GUIDANCE, ("architecture", "design", "structure", "organize", "pattern", "component"))
+)
+
+# All indicators in one pattern, one named group per type in check order. The
+# lookahead matches at every position, so each keyword occurrence is seen even
+# where keywords overlap, in a single scan of the request
+_CLASSIFIER = re.compile("(?=(?:" + "|".join(
+    f"(?P<{assistance_type.name}>{'|'.join(map(re.escape, keywords))})"
+    for assistance_type, keywords in _ASSISTANCE_KEYWORDS
+) + "))")
+_CLASSIFIER_RANK = {assistance_type.name: rank for rank, (assistance_type, _) in enumerate(_ASSISTANCE_KEYWORDS)}
+
+
+@functools.lru_cache(maxsize=256)
+def _classify_request(request_lower: str) -> AssistanceType:
+    """Map a lower-cased request to its assistance type (memoized; users often re-ask)."""
+    # The earliest type in check order with any keyword present wins
+    rank = min((_CLASSIFIER_RANK[match.lastgroup] for match in _CLASSIFIER.finditer(request_lower)), default=None)
+    if rank is None:
+        return AssistanceType.GENERAL_GUIDANCE
+    return _ASSISTANCE_KEYWORDS[rank][0]
+
+
 class ADKProjectAssistantAgent:
     """
     ADK Project Assistant Agent that uses all MCP tools to provide comprehensive
@@ -113,11 +480,13 @@ class ADKProjectAssistantAgent:
         self.mcp_client = mcp_client
         self.mcp_server_name = "arkaft-google-adk"
         self.project_context = {}
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self._result_cache: "OrderedDict[tuple, ProjectAssistanceResult]" = OrderedDict()
         
     async def provide_assistance(
         self, 
         user_request: str, 
-        project_context: Dict[str, Any],
+        project_context: Union[Dict[str, Any], ProjectContext],
         assistance_type: Optional[AssistanceType] = None
     ) -> ProjectAssistanceResult:
         """
@@ -131,11 +500,23 @@ class ADKProjectAssistantAgent:
         Returns:
             ProjectAssistanceResult with comprehensive guidance
         """
+        # Parse the context once; helpers receive the immutable ProjectContext
+        if not isinstance(project_context, ProjectContext):
+            project_context = ProjectContext.from_dict(project_context)
+        
         try:
             # Step 1: Determine assistance type if not specified
             if not assistance_type:
                 assistance_type = self._determine_assistance_type(user_request, project_context)
             
+            # Repeated requests are served from the LRU result cache, keyed on
+            # strings only (the context's canonical JSON) so hashing can't fail
+            cache_key = (assistance_type, user_request, project_context.raw)
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                return _copy_result(cached)
+            
             # Step 2: Gather comprehensive information using all MCP tools
             mcp_data = await self._gather_comprehensive_data(
                 user_request, project_context, assistance_type
@@ -147,87 +528,110 @@ class ADKProjectAssistantAgent:
             )
             
             # Step 4: Compile comprehensive assistance result
-            return await self._compile_assistance_result(
+            result = await self._compile_assistance_result(
                 assistance_type, user_request, primary_guidance, mcp_data
             )
             
+            # Only cache complete answers; degraded ones should be retried
+            if not any(isinstance(data, dict) and "error" in data for data in mcp_data.values()):
+                self._result_cache[cache_key] = _copy_result(result)
+                if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+            
+            return result
+            
         except Exception as e:
             # Graceful degradation on MCP failures
             return await self._fallback_assistance(user_request, project_context, str(e))
     
-    def _determine_assistance_type(self, user_request: str, project_context: Dict[str, Any]) -> AssistanceType:
+    def _determine_assistance_type(self, user_request: str, project_context: ProjectContext) -> AssistanceType:
         """Determine the type of assistance needed based on user request and context."""
-        request_lower = user_request.lower()
-        
-        # Project setup indicators (check first for specificity)
-        setup_keywords = ["setup", "set up", "create", "initialize", "start", "new project", "scaffold"]
-        if any(keyword in request_lower for keyword in setup_keywords):
-            return AssistanceType.PROJECT_SETUP
-        
-        # Task breakdown indicators (check before code examples to avoid conflicts)
-        task_keywords = ["break down", "steps", "plan", "roadmap", "guide", "process"]
-        if any(keyword in request_lower for keyword in task_keywords):
-            return AssistanceType.TASK_BREAKDOWN
-        
-        # Code examples indicators
-        code_keywords = ["example", "code", "implement", "how to", "show me", "sample"]
-        if any(keyword in request_lower for keyword in code_keywords):
-            return AssistanceType.CODE_EXAMPLES
-        
-        # Troubleshooting indicators
-        trouble_keywords = ["error", "issue", "problem", "fix", "debug", "not working", "help"]
-        if any(keyword in request_lower for keyword in trouble_keywords):
-            return AssistanceType.TROUBLESHOOTING
-        
-        # Architecture guidance indicators (check after more specific types)
-        arch_keywords = ["architecture", "design", "structure", "organize", "pattern", "component"]
-        if any(keyword in request_lower for keyword in arch_keywords):
-            return AssistanceType.ARCHITECTURE_GUIDANCE
-        
-        return AssistanceType.GENERAL_GUIDANCE
+        return _classify_request(user_request.lower())
     
     async def _gather_comprehensive_data(
         self, 
         user_request: str, 
-        project_context: Dict[str, Any],
+        project_context: ProjectContext,
         assistance_type: AssistanceType
     ) -> Dict[str, Any]:
         """Gather data from all relevant MCP tools."""
         
-        mcp_data = {}
-        
-        # Always get ADK query results for documentation and guidance
-        mcp_data["adk_query"] = await self._query_adk_documentation(user_request, assistance_type)
-        
-        # Get best practices relevant to the assistance type
-        mcp_data["best_practices"] = await self._get_relevant_best_practices(
-            user_request, assistance_type, project_context
-        )
+        # Always get ADK query results and best practices relevant to the assistance type
+        calls = {
+            "adk_query": self._query_adk_documentation(user_request, assistance_type),
+            "best_practices": self._get_relevant_best_practices(
+                user_request, assistance_type, project_context
+            )
+        }
         
         # Get architectural validation if relevant
-        if assistance_type in [AssistanceType.ARCHITECTURE_GUIDANCE, AssistanceType.PROJECT_SETUP]:
-            mcp_data["architecture_validation"] = await self._get_architectural_guidance(
+        if assistance_type in (AssistanceType.ARCHITECTURE_GUIDANCE, AssistanceType.PROJECT_SETUP):
+            calls["architecture_validation"] = self._get_architectural_guidance(
                 user_request, project_context
             )
         
         # Get code review insights if code-related
-        if assistance_type in [AssistanceType.CODE_EXAMPLES, AssistanceType.TROUBLESHOOTING]:
-            mcp_data["code_insights"] = await self._get_code_insights(
+        if assistance_type in (AssistanceType.CODE_EXAMPLES, AssistanceType.TROUBLESHOOTING):
+            calls["code_insights"] = self._get_code_insights(
                 user_request, project_context
             )
         
-        return mcp_data
-    
+        # The tool calls are independent, so issue them together; a tool that
+        # raises is simply left out of the data
+        results = await asyncio.gather(*calls.values(), return_exceptions=True)
+        return {
+            key: result
+            for key, result in zip(calls, results)
+            if not isinstance(result, Exception)
+        }
+
+    async def _call_tool_coalesced(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Call an MCP tool, sharing the result with identical calls already in flight.
+
+        Concurrent requests that resolve to the same tool and arguments await the
+        first caller's future instead of issuing a duplicate MCP request. A
+        cancelled waiter leaves the shared call running; if the first caller is
+        cancelled, the waiters fail with an error instead of waiting forever.
+        """
+        key = (tool_name, json.dumps(arguments, sort_keys=True, default=str))
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self.mcp_client.call_tool(
+                server_name=self.mcp_server_name,
+                tool_name=tool_name,
+                arguments=arguments
+            )
+            if not future.done():
+                future.set_result(result)
+            return result
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+            # Still pending only if this call was cancelled; the waiters were not
+            if not future.done():
+                future.set_exception(RuntimeError(f"MCP tool call {tool_name} was cancelled"))
+            # Mark any exception as retrieved in case no other caller was waiting
+            if not future.cancelled():
+                future.exception()
+
     async def _query_adk_documentation(self, user_request: str, assistance_type: AssistanceType) -> Dict[str, Any]:
         """Query ADK documentation using adk_query MCP tool."""
         try:
             # Enhance query based on assistance type
             enhanced_query = self._enhance_query_for_type(user_request, assistance_type)
             
-            result = await self.mcp_client.call_tool(
-                server_name=self.mcp_server_name,
-                tool_name="adk_query",
-                arguments={
+            result = await self._call_tool_coalesced(
+                "adk_query",
+                {
                     "query": enhanced_query,
                     "include_examples": True,
                     "include_best_practices": True,
@@ -247,20 +651,19 @@ class ADKProjectAssistantAgent:
         self, 
         user_request: str, 
         assistance_type: AssistanceType,
-        project_context: Dict[str, Any]
+        project_context: ProjectContext
     ) -> Dict[str, Any]:
         """Get best practices using get_best_practices MCP tool."""
         try:
             scenario = self._determine_best_practices_scenario(assistance_type, user_request)
             
-            result = await self.mcp_client.call_tool(
-                server_name=self.mcp_server_name,
-                tool_name="get_best_practices",
-                arguments={
+            result = await self._call_tool_coalesced(
+                "get_best_practices",
+                {
                     "scenario": scenario,
                     "context": {
                         "assistance_type": assistance_type.value,
-                        "project_context": project_context,
+                        "project_context": project_context.to_dict(),
                         "comprehensive_guidance": True
                     }
                 }
@@ -273,17 +676,16 @@ class ADKProjectAssistantAgent:
     async def _get_architectural_guidance(
         self, 
         user_request: str, 
-        project_context: Dict[str, Any]
+        project_context: ProjectContext
     ) -> Dict[str, Any]:
         """Get architectural guidance using validate_architecture MCP tool."""
         try:
             # Create a sample structure for validation if none exists
             sample_content = self._create_sample_content_for_validation(user_request, project_context)
             
-            result = await self.mcp_client.call_tool(
-                server_name=self.mcp_server_name,
-                tool_name="validate_architecture",
-                arguments={
+            result = await self._call_tool_coalesced(
+                "validate_architecture",
+                {
                     "file_content": sample_content,
                     "file_path": "project_structure_analysis",
                     "validation_focus": [
@@ -303,17 +705,16 @@ class ADKProjectAssistantAgent:
     async def _get_code_insights(
         self, 
         user_request: str, 
-        project_context: Dict[str, Any]
+        project_context: ProjectContext
     ) -> Dict[str, Any]:
         """Get code insights using review_rust_file MCP tool."""
         try:
             # Create sample code for analysis if none provided
             sample_code = self._create_sample_code_for_analysis(user_request, project_context)
             
-            result = await self.mcp_client.call_tool(
-                server_name=self.mcp_server_name,
-                tool_name="review_rust_file",
-                arguments={
+            result = await self._call_tool_coalesced(
+                "review_rust_file",
+                {
                     "file_content": sample_code,
                     "file_path": "example_analysis.rs",
                     "focus_areas": [
@@ -334,7 +735,7 @@ class ADKProjectAssistantAgent:
         self,
         assistance_type: AssistanceType,
         user_request: str,
-        project_context: Dict[str, Any],
+        project_context: ProjectContext,
         mcp_data: Dict[str, Any]
     ) -> Union[ProjectSetupGuidance, ArchitecturalGuidance, List[CodeExample], 
                TroubleshootingGuidance, TaskBreakdown, str]:
@@ -361,7 +762,7 @@ class ADKProjectAssistantAgent:
     def _generate_project_setup_guidance(
         self, 
         user_request: str, 
-        project_context: Dict[str, Any], 
+        project_context: ProjectContext, 
         mcp_data: Dict[str, Any]
     ) -> ProjectSetupGuidance:
         """Generate project setup guidance."""
@@ -464,7 +865,7 @@ class ADKProjectAssistantAgent:
     def _generate_architectural_guidance(
         self, 
         user_request: str, 
-        project_context: Dict[str, Any], 
+        project_context: ProjectContext, 
         mcp_data: Dict[str, Any]
     ) -> ArchitecturalGuidance:
         """Generate architectural decision guidance."""
@@ -543,142 +944,24 @@ class ADKProjectAssistantAgent:
     def _generate_code_examples(
         self, 
         user_request: str, 
-        project_context: Dict[str, Any], 
+        project_context: ProjectContext, 
         mcp_data: Dict[str, Any]
     ) -> List[CodeExample]:
         """Generate code examples."""
         
-        examples = []
+        # Copy the shared built-ins so callers can't mutate them for later requests
+        examples = [
+            dataclasses.replace(
+                example,
+                best_practices=list(example.best_practices),
+                related_patterns=list(example.related_patterns)
+            )
+            for example in _load_static_examples()
+        ]
         adk_info = mcp_data.get("adk_query", {})
         code_insights = mcp_data.get("code_insights", {})
         best_practices = mcp_data.get("best_practices", {})
         
-        # Basic ADK component example
-        examples.append(CodeExample(
-            title="Basic ADK Component",
-            description="A simple ADK component implementation",
-            code='''use adk_core::{Component, ComponentContext, Result};
-
-#[derive(Debug)]
-pub struct MyComponent {
-    name: String,
-}
-
-impl MyComponent {
-    pub fn new(name: String) -> Self {
-        Self { name }
-    }
-}
-
-impl Component for MyComponent {
-    fn initialize(&mut self, ctx: &ComponentContext) -> Result<()> {
-        println!("Initializing component: {}", self.name);
-        Ok(())
-    }
-    
-    fn start(&mut self, ctx: &ComponentContext) -> Result<()> {
-        println!("Starting component: {}", self.name);
-        Ok(())
-    }
-    
-    fn stop(&mut self, ctx: &ComponentContext) -> Result<()> {
-        println!("Stopping component: {}", self.name);
-        Ok(())
-    }
-}''',
-            language="rust",
-            explanation="This example shows the basic structure of an ADK component with lifecycle methods.",
-            best_practices=[
-                "Implement all lifecycle methods",
-                "Use proper error handling with Result types",
-                "Include meaningful logging and debugging information"
-            ],
-            related_patterns=["Component Lifecycle", "Dependency Injection", "Error Handling"]
-        ))
-        
-        # Service implementation example
-        examples.append(CodeExample(
-            title="ADK Service Implementation",
-            description="A service that handles business logic",
-            code='''use adk_core::{Service, ServiceContext, Result};
-use async_trait::async_trait;
-
-pub struct UserService {
-    repository: Box<dyn UserRepository>,
-}
-
-impl UserService {
-    pub fn new(repository: Box<dyn UserRepository>) -> Self {
-        Self { repository }
-    }
-}
-
-#[async_trait]
-impl Service for UserService {
-    async fn handle_request(&self, request: ServiceRequest) -> Result<ServiceResponse> {
-        match request.action.as_str() {
-            "get_user" => {
-                let user_id = request.params.get("id")
-                    .ok_or_else(|| Error::MissingParameter("id"))?;
-                
-                let user = self.repository.find_by_id(user_id).await?;
-                Ok(ServiceResponse::success(user))
-            }
-            _ => Err(Error::UnsupportedAction(request.action))
-        }
-    }
-}''',
-            language="rust",
-            explanation="This example demonstrates a service implementation with async operations and error handling.",
-            best_practices=[
-                "Use async/await for I/O operations",
-                "Implement proper error handling",
-                "Use dependency injection for repositories",
-                "Validate input parameters"
-            ],
-            related_patterns=["Service Pattern", "Repository Pattern", "Async Programming"]
-        ))
-        
-        # Configuration example
-        examples.append(CodeExample(
-            title="ADK Configuration",
-            description="Configuration setup for ADK applications",
-            code='''[package]
-name = "my-adk-app"
-version = "0.1.0"
-edition = "2021"
-
-[dependencies]
-adk-core = "0.1"
-adk-runtime = "0.1"
-adk-macros = "0.1"
-tokio = { version = "1.0", features = ["full"] }
-serde = { version = "1.0", features = ["derive"] }
-tracing = "0.1"
-
-[adk]
-version = "0.1"
-runtime = "tokio"
-features = ["components", "services", "async"]
-
-[adk.components]
-auto_discovery = true
-base_path = "src/components"
-
-[adk.services]
-auto_registration = true
-base_path = "src/services"''',
-            language="toml",
-            explanation="This shows the recommended Cargo.toml configuration for ADK projects.",
-            best_practices=[
-                "Use specific ADK version constraints",
-                "Enable required features only",
-                "Configure auto-discovery for components",
-                "Set up proper logging and tracing"
-            ],
-            related_patterns=["Configuration Management", "Dependency Management"]
-        ))
-        
         # Extract additional examples from MCP data
         if "examples" in adk_info:
             for example_data in adk_info["examples"]:
@@ -697,7 +980,7 @@ base_path = "src/services"''',
     def _generate_troubleshooting_guidance(
         self, 
         user_request: str, 
-        project_context: Dict[str, Any], 
+        project_context: ProjectContext, 
         mcp_data: Dict[str, Any]
     ) -> TroubleshootingGuidance:
         """Generate troubleshooting guidance."""
@@ -780,7 +1063,7 @@ base_path = "src/services"''',
     def _generate_task_breakdown(
         self, 
         user_request: str, 
-        project_context: Dict[str, Any], 
+        project_context: ProjectContext, 
         mcp_data: Dict[str, Any]
     ) -> TaskBreakdown:
         """Generate task breakdown with step-by-step guidance."""
@@ -796,84 +1079,20 @@ base_path = "src/services"''',
             complexity_level = "High"
             estimated_time = "1-2 days"
         
-        # Generate prerequisites
-        prerequisites = [
-            "ADK development environment set up",
-            "Basic understanding of Rust and ADK concepts",
-            "Project structure in place"
-        ]
-        
-        # Generate detailed steps
-        steps = [
-            {
-                "phase": "Planning",
-                "step": "1. Analyze Requirements",
-                "description": "Break down the task into smaller components",
-                "estimated_time": "15-30 minutes",
-                "deliverables": ["Requirements document", "Component list"]
-            },
-            {
-                "phase": "Design",
-                "step": "2. Design Architecture",
-                "description": "Plan the component structure and interfaces",
-                "estimated_time": "30-60 minutes",
-                "deliverables": ["Architecture diagram", "Interface definitions"]
-            },
-            {
-                "phase": "Implementation",
-                "step": "3. Implement Core Logic",
-                "description": "Write the main functionality",
-                "estimated_time": "1-2 hours",
-                "deliverables": ["Core implementation", "Unit tests"]
-            },
-            {
-                "phase": "Integration",
-                "step": "4. Integrate Components",
-                "description": "Wire components together and test integration",
-                "estimated_time": "30-60 minutes",
-                "deliverables": ["Integrated system", "Integration tests"]
-            },
-            {
-                "phase": "Validation",
-                "step": "5. Test and Validate",
-                "description": "Comprehensive testing and validation",
-                "estimated_time": "30-45 minutes",
-                "deliverables": ["Test results", "Validation report"]
-            }
-        ]
-        
-        # Generate validation points
-        validation_points = [
-            "Each component compiles without errors",
-            "Unit tests pass for all components",
-            "Integration tests validate component interaction",
-            "Code follows ADK best practices",
-            "Documentation is complete and accurate"
-        ]
-        
-        # Generate success criteria
-        success_criteria = [
-            "All functionality works as specified",
-            "Code quality meets project standards",
-            "Performance requirements are met",
-            "Error handling is comprehensive",
-            "Documentation is complete"
-        ]
-        
         return TaskBreakdown(
             task_description=user_request,
             complexity_level=complexity_level,
             estimated_time=estimated_time,
-            prerequisites=prerequisites,
-            steps=steps,
-            validation_points=validation_points,
-            success_criteria=success_criteria
+            prerequisites=_TASK_PREREQS,
+            steps=_DEFAULT_STEPS,
+            validation_points=_TASK_VALIDATION,
+            success_criteria=_TASK_SUCCESS
         )
     
     def _generate_general_guidance(
         self, 
         user_request: str, 
-        project_context: Dict[str, Any], 
+        project_context: ProjectContext, 
         mcp_data: Dict[str, Any]
     ) -> str:
         """Generate general guidance response."""
@@ -881,35 +1100,37 @@ base_path = "src/services"''',
         adk_info = mcp_data.get("adk_query", {})
         best_practices = mcp_data.get("best_practices", {})
         
-        guidance = f"## ADK Project Guidance\n\n"
-        guidance += f"**Your Request**: {user_request}\n\n"
+        parts = ["## ADK Project Guidance", "", f"**Your Request**: {user_request}", ""]
         
         # Add information from ADK query
         if "answer" in adk_info:
-            guidance += f"**ADK Documentation Response**:\n{adk_info['answer']}\n\n"
+            parts.append(f"**ADK Documentation Response**:\n{adk_info['answer']}")
+            parts.append("")
         
         # Add best practices
         if "recommendations" in best_practices:
-            guidance += "**Best Practices**:\n"
+            parts.append("**Best Practices**:")
             for practice in best_practices["recommendations"]:
-                guidance += f"- {practice}\n"
-            guidance += "\n"
+                parts.append(f"- {practice}")
+            parts.append("")
         
         # Add general ADK guidance
-        guidance += "**General ADK Development Tips**:\n"
-        guidance += "- Follow component-based architecture patterns\n"
-        guidance += "- Use proper error handling with Result types\n"
-        guidance += "- Implement comprehensive logging and monitoring\n"
-        guidance += "- Write unit and integration tests\n"
-        guidance += "- Follow ADK naming conventions and best practices\n\n"
-        
-        guidance += "**Next Steps**:\n"
-        guidance += "- Review the official ADK documentation\n"
-        guidance += "- Start with a simple component implementation\n"
-        guidance += "- Gradually add complexity as you learn\n"
-        guidance += "- Join the ADK developer community for support\n"
-        
-        return guidance
+        parts.append("**General ADK Development Tips**:")
+        parts.append("- Follow component-based architecture patterns")
+        parts.append("- Use proper error handling with Result types")
+        parts.append("- Implement comprehensive logging and monitoring")
+        parts.append("- Write unit and integration tests")
+        parts.append("- Follow ADK naming conventions and best practices")
+        parts.append("")
+        
+        parts.append("**Next Steps**:")
+        parts.append("- Review the official ADK documentation")
+        parts.append("- Start with a simple component implementation")
+        parts.append("- Gradually add complexity as you learn")
+        parts.append("- Join the ADK developer community for support")
+        parts.append("")
+        
+        return "\n".join(parts)
     
     async def _compile_assistance_result(
         self,
@@ -922,85 +1143,45 @@ base_path = "src/services"''',
         """Compile comprehensive assistance result."""
         
         # Create summary
-        summary = f"Comprehensive {assistance_type.value.replace('_', ' ').title()} guidance for: {user_request}"
-        
-        # Collect additional resources
-        additional_resources = [
-            "Official Google ADK Documentation",
-            "ADK Best Practices Guide",
-            "ADK Community Forums",
-            "ADK GitHub Repository"
-        ]
+        summary = f"Comprehensive {assistance_type.display} guidance for: {user_request}"
         
-        # Extract resources from MCP data
-        for data in mcp_data.values():
-            if isinstance(data, dict) and "resources" in data:
-                additional_resources.extend(data["resources"])
-        
-        # Collect best practices
-        best_practices = [
-            "Follow ADK architectural patterns",
-            "Implement proper error handling",
-            "Use structured logging and monitoring",
-            "Write comprehensive tests",
-            "Document your code and APIs"
-        ]
+        # Seed defaults (dict keys act as an insertion-ordered set)
+        additional_resources = dict.fromkeys(_DEFAULT_RESOURCES)
+        best_practices = dict.fromkeys(_DEFAULT_BEST_PRACTICES)
+        references = dict.fromkeys(_DEFAULT_REFERENCES)
         
-        # Extract best practices from MCP data
+        # Extract resources, best practices and references from MCP data in one pass
         for data in mcp_data.values():
-            if isinstance(data, dict) and "best_practices" in data:
-                if isinstance(data["best_practices"], list):
-                    best_practices.extend(data["best_practices"])
-        
-        # Collect references
-        references = [
-            "Google ADK Official Documentation",
-            "ADK Rust API Reference",
-            "ADK Architecture Guide"
-        ]
-        
-        # Extract references from MCP data
-        for data in mcp_data.values():
-            if isinstance(data, dict) and "references" in data:
-                references.extend(data["references"])
-        
-        # Generate follow-up suggestions
-        follow_up_suggestions = [
-            "Review the provided guidance and examples",
-            "Start with a simple implementation",
-            "Test your implementation thoroughly",
-            "Seek feedback from the ADK community",
-            "Iterate and improve based on experience"
-        ]
-        
-        # Customize follow-up based on assistance type
-        if assistance_type == AssistanceType.PROJECT_SETUP:
-            follow_up_suggestions.extend([
-                "Set up your development environment",
-                "Create a simple 'Hello World' ADK application",
-                "Explore ADK component examples"
-            ])
-        elif assistance_type == AssistanceType.CODE_EXAMPLES:
-            follow_up_suggestions.extend([
-                "Try implementing the provided examples",
-                "Modify examples to fit your use case",
-                "Create your own variations"
-            ])
+            if not isinstance(data, dict):
+                continue
+            resources = data.get("resources")
+            if resources:
+                additional_resources.update(dict.fromkeys(resources))
+            # review_rust_file reports best_practices as a compliance dict; only lists are harvested
+            practices = data.get("best_practices")
+            if isinstance(practices, list):
+                best_practices.update(dict.fromkeys(practices))
+            refs = data.get("references")
+            if refs:
+                references.update(dict.fromkeys(refs))
+        
+        # Generate follow-up suggestions, customized by assistance type
+        follow_up_suggestions = [*_DEFAULT_FOLLOWUP, *_TYPE_FOLLOWUP_EXTRAS.get(assistance_type, ())]
         
         return ProjectAssistanceResult(
             assistance_type=assistance_type,
             summary=summary,
             primary_guidance=primary_guidance,
-            additional_resources=list(set(additional_resources)),  # Remove duplicates
-            best_practices=list(set(best_practices)),  # Remove duplicates
-            references=list(set(references)),  # Remove duplicates
+            additional_resources=tuple(additional_resources),
+            best_practices=tuple(best_practices),
+            references=tuple(references),
             follow_up_suggestions=follow_up_suggestions
         )
     
     async def _fallback_assistance(
         self, 
         user_request: str, 
-        project_context: Dict[str, Any], 
+        project_context: ProjectContext, 
         error_msg: str
     ) -> ProjectAssistanceResult:
         """Provide fallback assistance when MCP tools are unavailable."""
@@ -1008,81 +1189,16 @@ base_path = "src/services"''',
         # Determine the intended assistance type even in fallback mode
         intended_type = self._determine_assistance_type(user_request, project_context)
         
-        fallback_guidance = f"""
-# Fallback ADK Project Assistance
-
-**Your Request**: {user_request}
-
-**Notice**: The MCP server is currently unavailable ({error_msg}). Providing basic guidance based on general ADK knowledge.
-
-## General ADK Guidance
-
-### Getting Started
-1. **Set up Rust Development Environment**
-   - Install Rust toolchain (rustup)
-   - Set up your IDE with Rust support
-   - Install ADK CLI tools if available
-
-2. **Create ADK Project**
-   ```bash
-   cargo new my-adk-project
-   cd my-adk-project
-   ```
-
-3. **Add ADK Dependencies**
-   ```toml
-   [dependencies]
-   adk-core = "0.1"
-   adk-runtime = "0.1"
-   tokio = {{ version = "1.0", features = ["full"] }}
-   ```
-
-### Basic ADK Patterns
-- **Components**: Implement the Component trait for reusable functionality
-- **Services**: Use the Service trait for business logic
-- **Configuration**: Use adk.toml for ADK-specific settings
-- **Error Handling**: Always use Result types for error handling
-
-### Best Practices
-- Follow Rust naming conventions
-- Implement proper error handling
-- Use async/await for I/O operations
-- Write unit and integration tests
-- Document your public APIs
-
-### Next Steps
-- Review official ADK documentation when MCP server is available
-- Start with simple component implementations
-- Join the ADK developer community
-- Practice with example projects
-
-**Recommendation**: Retry your request when the MCP server is available for comprehensive, up-to-date guidance.
-"""
+        fallback_guidance = _FALLBACK_TEMPLATE.substitute(user_request=user_request, error_msg=error_msg)
         
         return ProjectAssistanceResult(
             assistance_type=intended_type,  # Use the intended type, not always GENERAL_GUIDANCE
             summary=f"Fallback guidance for: {user_request} (MCP server unavailable)",
             primary_guidance=fallback_guidance,
-            additional_resources=[
-                "Official Google ADK Documentation (when available)",
-                "Rust Programming Language Book",
-                "Tokio Async Runtime Documentation"
-            ],
-            best_practices=[
-                "Use proper error handling",
-                "Follow Rust conventions",
-                "Implement comprehensive testing",
-                "Document your code"
-            ],
-            references=[
-                "Manual ADK documentation review recommended",
-                "Community forums and resources"
-            ],
-            follow_up_suggestions=[
-                "Retry when MCP server is available",
-                "Start with basic Rust ADK examples",
-                "Review official documentation"
-            ]
+            additional_resources=_FALLBACK_RESOURCES,
+            best_practices=_FALLBACK_BEST_PRACTICES,
+            references=_FALLBACK_REFERENCES,
+            follow_up_suggestions=list(_FALLBACK_FOLLOWUP)
         )
     
     # Helper methods
@@ -1090,174 +1206,79 @@ base_path = "src/services"''',
     def _enhance_query_for_type(self, user_request: str, assistance_type: AssistanceType) -> str:
         """Enhance the user query based on assistance type."""
         
-        enhancements = {
-            AssistanceType.PROJECT_SETUP: "project setup, initialization, configuration, dependencies",
-            AssistanceType.ARCHITECTURE_GUIDANCE: "architecture, design patterns, component organization, best practices",
-            AssistanceType.CODE_EXAMPLES: "code examples, implementation patterns, sample code, tutorials",
-            AssistanceType.TROUBLESHOOTING: "troubleshooting, error resolution, debugging, common issues",
-            AssistanceType.TASK_BREAKDOWN: "step-by-step guide, implementation plan, task breakdown, roadmap",
-            AssistanceType.GENERAL_GUIDANCE: "general guidance, best practices, recommendations"
-        }
-        
-        enhancement = enhancements.get(assistance_type, "")
-        return f"{user_request} - Focus on: {enhancement}"
+        return f"{user_request}{_ENHANCEMENT_SUFFIX.get(assistance_type, _DEFAULT_ENHANCEMENT_SUFFIX)}"
     
     def _determine_best_practices_scenario(self, assistance_type: AssistanceType, user_request: str) -> str:
         """Determine the best practices scenario based on assistance type."""
         
-        scenarios = {
-            AssistanceType.PROJECT_SETUP: "project_initialization",
-            AssistanceType.ARCHITECTURE_GUIDANCE: "architectural_design",
-            AssistanceType.CODE_EXAMPLES: "implementation_patterns",
-            AssistanceType.TROUBLESHOOTING: "error_handling",
-            AssistanceType.TASK_BREAKDOWN: "development_process",
-            AssistanceType.GENERAL_GUIDANCE: "general_development"
-        }
-        
-        return scenarios.get(assistance_type, "general_development")
+        return _SCENARIOS.get(assistance_type, "general_development")
     
-    def _create_sample_content_for_validation(self, user_request: str, project_context: Dict[str, Any]) -> str:
+    def _create_sample_content_for_validation(self, user_request: str, project_context: ProjectContext) -> str:
         """Create sample content for architectural validation."""
         
-        return f"""
-// Sample ADK project structure for validation
-// Request: {user_request}
-
-use adk_core::{{Component, Service, Result}};
-
-pub struct SampleComponent {{
-    name: String,
-}}
-
-impl Component for SampleComponent {{
-    fn initialize(&mut self, ctx: &ComponentContext) -> Result<()> {{
-        // Initialization logic
-        Ok(())
-    }}
-}}
-
-pub struct SampleService {{
-    component: SampleComponent,
-}}
-
-impl Service for SampleService {{
-    async fn handle_request(&self, request: ServiceRequest) -> Result<ServiceResponse> {{
-        // Service logic
-        Ok(ServiceResponse::success(()))
-    }}
-}}
-"""
+        return _VALIDATION_TEMPLATE.substitute(user_request=user_request)
     
-    def _create_sample_code_for_analysis(self, user_request: str, project_context: Dict[str, Any]) -> str:
+    def _create_sample_code_for_analysis(self, user_request: str, project_context: ProjectContext) -> str:
         """Create sample code for analysis."""
         
-        return f"""
-// Sample ADK code for analysis
-// Request: {user_request}
-
-use adk_core::{{Component, Result, Error}};
-
-pub struct ExampleComponent {{
-    initialized: bool,
-}}
-
-impl ExampleComponent {{
-    pub fn new() -> Self {{
-        Self {{ initialized: false }}
-    }}
-}}
-
-impl Component for ExampleComponent {{
-    fn initialize(&mut self, _ctx: &ComponentContext) -> Result<()> {{
-        self.initialized = true;
-        println!("Component initialized");
-        Ok(())
-    }}
-    
-    fn start(&mut self, _ctx: &ComponentContext) -> Result<()> {{
-        if !self.initialized {{
-            return Err(Error::NotInitialized);
-        }}
-        println!("Component started");
-        Ok(())
-    }}
-}}
-"""
+        return _ANALYSIS_TEMPLATE.substitute(user_request=user_request)
 
 
 def format_project_assistance_result(result: ProjectAssistanceResult) -> str:
     """Format the project assistance result as markdown for display."""
     
-    output = []
-    output.append("# ADK Project Assistant Results\n")
+    buf = io.StringIO()
+    w = buf.write
+    w("# ADK Project Assistant Results\n\n")
     
     # Summary
-    output.append("## Summary")
-    output.append(result.summary)
-    output.append(f"\n**Assistance Type**: {result.assistance_type.value.replace('_', ' ').title()}\n")
+    w("## Summary\n")
+    w(result.summary)
+    w(f"\n\n**Assistance Type**: {result.assistance_type.display}\n\n")
     
     # Primary Guidance (format based on type)
-    output.append("## Primary Guidance\n")
-    
-    if isinstance(result.primary_guidance, ProjectSetupGuidance):
-        output.extend(_format_project_setup_guidance(result.primary_guidance))
-    elif isinstance(result.primary_guidance, ArchitecturalGuidance):
-        output.extend(_format_architectural_guidance(result.primary_guidance))
-    elif isinstance(result.primary_guidance, list) and result.primary_guidance and isinstance(result.primary_guidance[0], CodeExample):
-        output.extend(_format_code_examples(result.primary_guidance))
-    elif isinstance(result.primary_guidance, TroubleshootingGuidance):
-        output.extend(_format_troubleshooting_guidance(result.primary_guidance))
-    elif isinstance(result.primary_guidance, TaskBreakdown):
-        output.extend(_format_task_breakdown(result.primary_guidance))
+    w("## Primary Guidance\n\n")
+    
+    guidance = result.primary_guidance
+    formatter = _FORMATTERS.get(type(guidance))
+    if formatter:
+        w("\n".join(formatter(guidance)))
+    elif isinstance(guidance, list) and guidance and isinstance(guidance[0], CodeExample):
+        w("\n".join(_format_code_examples(guidance)))
     else:
-        output.append(str(result.primary_guidance))
-    
-    output.append("")
-    
-    # Best Practices
-    if result.best_practices:
-        output.append("## Best Practices")
-        for practice in result.best_practices:
-            output.append(f"- {practice}")
-        output.append("")
-    
-    # Additional Resources
-    if result.additional_resources:
-        output.append("## Additional Resources")
-        for resource in result.additional_resources:
-            output.append(f"- {resource}")
-        output.append("")
-    
-    # Follow-up Suggestions
-    if result.follow_up_suggestions:
-        output.append("## Follow-up Suggestions")
-        for i, suggestion in enumerate(result.follow_up_suggestions, 1):
-            output.append(f"{i}. {suggestion}")
-        output.append("")
-    
-    # References
-    if result.references:
-        output.append("## References")
-        for ref in result.references:
-            if ref.startswith("http"):
-                output.append(f"- [{ref}]({ref})")
-            else:
-                output.append(f"- {ref}")
-    
-    return "\n".join(output)
+        w(str(guidance))
+    w("\n\n")
+    
+    _render_bullets(w, "Best Practices", result.best_practices)
+    _render_bullets(w, "Additional Resources", result.additional_resources)
+    _render_bullets(w, "Follow-up Suggestions", result.follow_up_suggestions, numbered=True)
+    _render_bullets(w, "References", [
+        f"[{ref}]({ref})" if ref.startswith("http") else ref
+        for ref in result.references
+    ])
+    
+    return buf.getvalue()
+
+
+def _render_bullets(write: Callable[[str], Any], header: str, items: Sequence[str], *, numbered: bool = False) -> None:
+    """Write a '## header' section listing items as bullets (or a numbered list)."""
+    if not items:
+        return
+    write(f"## {header}\n")
+    if numbered:
+        write("".join(f"{i}. {item}\n" for i, item in enumerate(items, 1)))
+    else:
+        write("".join(f"- {item}\n" for item in items))
+    write("\n")
 
 
 def _format_project_setup_guidance(guidance: ProjectSetupGuidance) -> List[str]:
     """Format project setup guidance."""
-    output = []
-    
-    output.append(f"### {guidance.setup_type} Setup")
-    output.append("")
+    output = [f"### {guidance.setup_type} Setup", ""]
     
     # Prerequisites
     output.append("**Prerequisites:**")
-    for prereq in guidance.prerequisites:
-        output.append(f"- {prereq}")
+    output.extend(f"- {prereq}" for prereq in guidance.prerequisites)
     output.append("")
     
     # Setup Steps
@@ -1272,34 +1293,31 @@ def _format_project_setup_guidance(guidance: ProjectSetupGuidance) -> List[str]:
     # Configuration Files
     if guidance.configuration_files:
         output.append("**Configuration Files:**")
-        for config in guidance.configuration_files:
-            output.append(f"- **{config['file']}**: {config['purpose']}")
+        output.extend(f"- **{config['file']}**: {config['purpose']}" for config in guidance.configuration_files)
         output.append("")
     
     # Validation Steps
     output.append("**Validation Steps:**")
-    for validation in guidance.validation_steps:
-        output.append(f"- {validation}")
+    output.extend(f"- {validation}" for validation in guidance.validation_steps)
     output.append("")
     
     # Next Steps
     output.append("**Next Steps:**")
-    for next_step in guidance.next_steps:
-        output.append(f"- {next_step}")
+    output.extend(f"- {next_step}" for next_step in guidance.next_steps)
     
     return output
 
 
 def _format_architectural_guidance(guidance: ArchitecturalGuidance) -> List[str]:
     """Format architectural guidance."""
-    output = []
-    
-    output.append("### Architectural Decision Guidance")
-    output.append("")
-    output.append(f"**Context**: {guidance.decision_context}")
-    output.append("")
-    output.append(f"**Recommended Approach**: {guidance.recommended_approach}")
-    output.append("")
+    output = [
+        "### Architectural Decision Guidance",
+        "",
+        f"**Context**: {guidance.decision_context}",
+        "",
+        f"**Recommended Approach**: {guidance.recommended_approach}",
+        ""
+    ]
     
     # Alternatives
     output.append("**Alternative Approaches:**")
@@ -1313,74 +1331,70 @@ def _format_architectural_guidance(guidance: ArchitecturalGuidance) -> List[str]
     
     # Trade-offs
     output.append("**Trade-offs:**")
-    for category, trade_offs in guidance.trade_offs.items():
-        output.append(f"- **{category}**: {', '.join(trade_offs)}")
+    output.extend(
+        f"- **{category}**: {', '.join(trade_offs)}"
+        for category, trade_offs in guidance.trade_offs.items()
+    )
     output.append("")
     
     # Implementation Guidance
     output.append("**Implementation Guidance:**")
-    for impl_guide in guidance.implementation_guidance:
-        output.append(f"- {impl_guide}")
+    output.extend(f"- {impl_guide}" for impl_guide in guidance.implementation_guidance)
     output.append("")
     
     # Validation Criteria
     output.append("**Validation Criteria:**")
-    for criteria in guidance.validation_criteria:
-        output.append(f"- {criteria}")
+    output.extend(f"- {criteria}" for criteria in guidance.validation_criteria)
     
     return output
 
 
+# Heading, description and fenced code of one example, emitted as a single entry
+_EXAMPLE_TEMPLATE = "### Example {i}: {title}\n\n{desc}\n\n```{lang}\n{code}\n```\n"
+
+
 def _format_code_examples(examples: List[CodeExample]) -> List[str]:
-    """Format code examples."""
+    """Format code examples (one pre-joined block per example plus optional footers)."""
     output = []
     
     for i, example in enumerate(examples, 1):
-        output.append(f"### Example {i}: {example.title}")
-        output.append("")
-        output.append(example.description)
-        output.append("")
-        output.append(f"```{example.language}")
-        output.append(example.code)
-        output.append("```")
-        output.append("")
+        output.append(_EXAMPLE_TEMPLATE.format(
+            i=i,
+            title=example.title,
+            desc=example.description,
+            lang=example.language,
+            code=example.code
+        ))
         
         if example.explanation:
-            output.append(f"**Explanation**: {example.explanation}")
-            output.append("")
+            output.append(f"**Explanation**: {example.explanation}\n")
         
         if example.best_practices:
-            output.append("**Best Practices:**")
-            for practice in example.best_practices:
-                output.append(f"- {practice}")
-            output.append("")
+            output.append("**Best Practices:**\n" + "".join(f"- {practice}\n" for practice in example.best_practices))
         
         if example.related_patterns:
-            output.append(f"**Related Patterns**: {', '.join(example.related_patterns)}")
-            output.append("")
+            output.append(f"**Related Patterns**: {', '.join(example.related_patterns)}\n")
     
     return output
 
 
 def _format_troubleshooting_guidance(guidance: TroubleshootingGuidance) -> List[str]:
     """Format troubleshooting guidance."""
-    output = []
-    
-    output.append("### Troubleshooting Guidance")
-    output.append("")
-    output.append(f"**Issue**: {guidance.issue_description}")
-    output.append("")
+    output = [
+        "### Troubleshooting Guidance",
+        "",
+        f"**Issue**: {guidance.issue_description}",
+        ""
+    ]
     
     # Likely Causes
     output.append("**Likely Causes:**")
-    for cause in guidance.likely_causes:
-        output.append(f"- {cause}")
+    output.extend(f"- {cause}" for cause in guidance.likely_causes)
     output.append("")
     
     # Diagnostic Steps
     output.append("**Diagnostic Steps:**")
-    for i, step in enumerate(guidance.diagnostic_steps, 1):
-        output.append(f"{i}. {step}")
+    output.extend(f"{i}. {step}" for i, step in enumerate(guidance.diagnostic_steps, 1))
     output.append("")
     
     # Solutions
@@ -1393,61 +1407,65 @@ def _format_troubleshooting_guidance(guidance: TroubleshootingGuidance) -> List[
     
     # Prevention Tips
     output.append("**Prevention Tips:**")
-    for tip in guidance.prevention_tips:
-        output.append(f"- {tip}")
+    output.extend(f"- {tip}" for tip in guidance.prevention_tips)
     output.append("")
     
     # Related Issues
     if guidance.related_issues:
         output.append("**Related Issues:**")
-        for issue in guidance.related_issues:
-            output.append(f"- {issue}")
+        output.extend(f"- {issue}" for issue in guidance.related_issues)
     
     return output
 
 
 def _format_task_breakdown(breakdown: TaskBreakdown) -> List[str]:
     """Format task breakdown."""
-    output = []
-    
-    output.append("### Task Breakdown")
-    output.append("")
-    output.append(f"**Task**: {breakdown.task_description}")
-    output.append(f"**Complexity**: {breakdown.complexity_level}")
-    output.append(f"**Estimated Time**: {breakdown.estimated_time}")
-    output.append("")
+    output = [
+        "### Task Breakdown",
+        "",
+        f"**Task**: {breakdown.task_description}",
+        f"**Complexity**: {breakdown.complexity_level}",
+        f"**Estimated Time**: {breakdown.estimated_time}",
+        ""
+    ]
     
     # Prerequisites
     output.append("**Prerequisites:**")
-    for prereq in breakdown.prerequisites:
-        output.append(f"- {prereq}")
+    output.extend(f"- {prereq}" for prereq in breakdown.prerequisites)
     output.append("")
     
     # Steps
     output.append("**Implementation Steps:**")
     for step in breakdown.steps:
-        output.append(f"**{step['step']}** ({step.get('phase', 'Implementation')})")
-        output.append(f"- {step['description']}")
-        if 'estimated_time' in step:
-            output.append(f"- Time: {step['estimated_time']}")
-        if 'deliverables' in step:
-            output.append(f"- Deliverables: {', '.join(step['deliverables'])}")
-        output.append("")
+        output.extend((
+            f"**{step.step}** ({step.phase})",
+            f"- {step.description}",
+            f"- Time: {step.estimated_time}",
+            f"- Deliverables: {', '.join(step.deliverables)}",
+            ""
+        ))
     
     # Validation Points
     output.append("**Validation Points:**")
-    for point in breakdown.validation_points:
-        output.append(f"- {point}")
+    output.extend(f"- {point}" for point in breakdown.validation_points)
     output.append("")
     
     # Success Criteria
     output.append("**Success Criteria:**")
-    for criteria in breakdown.success_criteria:
-        output.append(f"- {criteria}")
+    output.extend(f"- {criteria}" for criteria in breakdown.success_criteria)
     
     return output
 
 
+# Exact-type dispatch for primary guidance; code examples arrive as a list
+_FORMATTERS = {
+    ProjectSetupGuidance: _format_project_setup_guidance,
+    ArchitecturalGuidance: _format_architectural_guidance,
+    TroubleshootingGuidance: _format_troubleshooting_guidance,
+    TaskBreakdown: _format_task_breakdown
+}
+
+
 # Example usage and testing
 async def main():
     """Example usage of the ADK Project Assistant Agent."""
@@ -1505,13 +1523,18 @@ async def main():
         ("Break down the task of building a user service", AssistanceType.TASK_BREAKDOWN)
     ]
     
-    for request, assistance_type in test_requests:
+    # The mock never blocks, so issue every request at once and print in order
+    results = await asyncio.gather(*(
+        agent.provide_assistance(request, {}, assistance_type)
+        for request, assistance_type in test_requests
+    ))
+    
+    for (request, assistance_type), result in zip(test_requests, results):
         print(f"\n{'='*60}")
         print(f"Testing: {request}")
         print(f"Type: {assistance_type.value}")
         print('='*60)
         
-        result = await agent.provide_assistance(request, {}, assistance_type)
         formatted_output = format_project_assistance_result(result)
         print(formatted_output)
 
@@ -9,10 +9,165 @@ best practices.
 
 import json
 import re
+import sys
 import asyncio
-from typing import Dict, Any, List, Optional
+import hashlib
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, is_dataclass
+from types import MappingProxyType, SimpleNamespace
+from operator import itemgetter
+from typing import Dict, Any, Iterator, List, Mapping, Optional
 from pathlib import Path
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import regex
+    HAS_REGEX = True
+except ImportError:
+    HAS_REGEX = False
+
+# Scan patterns run on the third-party regex engine when installed; the
+# pattern syntax used here is valid for both it and the stdlib re module
+_PATTERN_ENGINE = regex if HAS_REGEX else re
+_PATTERN_FLAGS = _PATTERN_ENGINE.IGNORECASE | _PATTERN_ENGINE.MULTILINE
+
+# Python 3.10+ supports slotted dataclasses
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Completed scans kept per agent, keyed by file path and content digest
+_SCAN_CACHE_SIZE = 1024
+
+# Insecure ADK patterns checked on every file alongside the configured ones
+_ADK_PATTERNS = (
+    {
+        'pattern': r'\.unwrap\(\)',
+        'severity': 'medium',
+        'message': 'Use of unwrap() can cause panics',
+        'suggestion': 'Use proper error handling with Result types'
+    },
+    {
+        'pattern': r'unsafe\s*\{',
+        'severity': 'high',
+        'message': 'Unsafe code block detected',
+        'suggestion': 'Ensure unsafe code is properly reviewed and documented'
+    },
+    {
+        'pattern': r'std::process::Command::new\([^)]*\)\.arg\([^)]*user_input',
+        'severity': 'high',
+        'message': 'Potential command injection vulnerability',
+        'suggestion': 'Sanitize user input before using in commands'
+    }
+)
+
+# Patterns made only of ordinary characters and escaped punctuation (e.g. "\.unwrap\(\)")
+# are plain substrings and skip the regex engine
+_LITERAL_PATTERN = re.compile(r'(?:[^\\.^$*+?{}\[\]|()]|\\[^0-9A-Za-z])+\Z')
+_ESCAPED_CHAR = re.compile(r'\\(.)')
+
+_SEVERITIES = ('high', 'medium', 'low')
+_SEVERITY_RANK = {'low': 0, 'medium': 1, 'high': 2}
+
+# Below this many matches per file, a running newline count beats building NumPy arrays
+_VECTORIZE_MIN_MATCHES = 64
+
+
+def _line_numbers(file_content: bytes, starts: List[int]) -> List[int]:
+    """Map sorted match offsets to 1-based line numbers, vectorized when NumPy is available"""
+    if HAS_NUMPY and len(starts) >= _VECTORIZE_MIN_MATCHES:
+        newlines = np.flatnonzero(np.frombuffer(file_content, dtype=np.uint8) == 0x0A)
+        lines = np.searchsorted(newlines, np.asarray(starts, dtype=np.int64), side='left') + 1
+        return lines.tolist()
+    
+    # Count only the newlines between consecutive matches; bytes.count scans
+    # the range in place without slicing
+    lines = []
+    line, last = 1, 0
+    for start in starts:
+        line += file_content.count(b'\n', last, start)
+        last = start
+        lines.append(line)
+    return lines
+
+
+# Mock ADK guidance; read-only so the one shared instance can be handed to every caller
+_STATIC_GUIDANCE = MappingProxyType({
+    'best_practices': (
+        'Use Result<T, E> for error handling instead of unwrap()',
+        'Implement proper input validation for all user inputs',
+        'Use ADK security middleware for authentication and authorization',
+        'Follow ADK guidelines for secure data handling'
+    ),
+    'adk_specific_recommendations': (
+        'Consider using ADK security utilities for common security tasks',
+        'Implement ADK logging patterns for security events',
+        'Use ADK configuration management for sensitive settings'
+    ),
+    'documentation_links': (
+        'https://docs.google.com/adk/security/best-practices',
+        'https://docs.google.com/adk/security/authentication',
+        'https://docs.google.com/adk/security/data-protection'
+    )
+})
+
+
+def _bucket_by_severity(issues: List["SecurityIssue"]) -> Dict[str, List["SecurityIssue"]]:
+    """Group issues by severity in a single pass (known severities are always present)"""
+    buckets = {severity: [] for severity in _SEVERITIES}
+    for issue in issues:
+        buckets.setdefault(issue.severity, []).append(issue)
+    return buckets
+
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy an analysis result down to its lists (issues and guidance are immutable)"""
+    copied = dict(result)
+    copied['security_issues'] = list(result['security_issues'])
+    copied['recommendations'] = [
+        {key: list(value) if isinstance(value, list) else value for key, value in recommendation.items()}
+        for recommendation in result['recommendations']
+    ]
+    copied['severity_summary'] = dict(result['severity_summary'])
+    return copied
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize issues and read-only guidance at the JSON boundary"""
+    if is_dataclass(obj):
+        return asdict(obj)
+    return dict(obj)
+
+
+def _dumps_pretty(obj: Any) -> str:
+    """Indented JSON, via orjson when installed (it serializes dataclasses natively)"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, default=_json_default)
+
+
+@dataclass(frozen=True, **_SLOTS)
+class SecurityIssue:
+    """A single pattern match reported by the security scan"""
+    type: str
+    name: str
+    severity: str
+    message: str
+    suggestion: str
+    line_number: int
+    matched_text: str
+    file_path: str
+
+
 # Import base agent (in real implementation, adjust import path)
 # from ..base_agent import BaseADKAgent
 # For this example, we'll define a minimal base class
@@ -36,13 +191,15 @@ class CustomSecurityAgent(BaseADKAgent):
         self.agent_name = "custom-security-agent"
         self.description = "Security-focused analysis for ADK projects"
         
-        # Load security patterns
-        self.security_patterns = self._load_security_patterns()
-        
         # Security configuration
         self.security_config = config.get('securityRules', {})
         self.strict_mode = self.security_config.get('strictMode', False)
         self.report_level = self.security_config.get('reportLevel', 'medium')
+        
+        # Load security patterns and compile them once for every scan
+        self.security_patterns = self._load_security_patterns()
+        self._regex_patterns, self._literal_patterns, self._pat = self._compile_patterns()
+        self._scan_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
     
     def _load_security_patterns(self) -> Dict[str, Any]:
         """Load security patterns from configuration file"""
@@ -64,9 +221,12 @@ class CustomSecurityAgent(BaseADKAgent):
                     "message": "Potential hardcoded secret detected",
                     "suggestion": "Use environment variables or secure configuration"
                 },
+                # format! literals are always double-quoted; the text between
+                # SELECT and the placeholder stops at the next SELECT, so each
+                # candidate is scanned once (same matches, linear time)
                 {
                     "name": "sql-injection-risk",
-                    "pattern": r"format!\s*\(\s*[\"'].*SELECT.*\{.*\}.*[\"']",
+                    "pattern": r'format!\s*\(\s*"[^"]*?SELECT(?:[^"{S]|S(?!ELECT))*\{[^"}]*\}[^"]*"',
                     "severity": "high",
                     "message": "Potential SQL injection vulnerability",
                     "suggestion": "Use parameterized queries or prepared statements"
@@ -81,160 +241,175 @@ class CustomSecurityAgent(BaseADKAgent):
             ]
         }
     
+    def _compile_patterns(self):
+        """
+        Split patterns into plain literals and true regexes.
+        
+        Outside strict mode, patterns below the configured report level are
+        dropped here, so they never reach the scanner.
+        Each regex is compiled on its own, since matches of different patterns
+        may overlap and every pattern must report them; literals are searched
+        with bytes.find. Pattern metadata is laid out as parallel tuples
+        indexed by pattern id.
+        """
+        sources = [
+            ('security_pattern', pattern_config['name'], pattern_config)
+            for pattern_config in self.security_patterns.get('patterns', [])
+        ]
+        sources.extend(
+            ('adk_security_pattern', f"adk-{pattern_config.get('name', 'security-issue')}", pattern_config)
+            for pattern_config in _ADK_PATTERNS
+        )
+        
+        # Unrecognized levels (e.g. "detailed") report everything
+        threshold = 0 if self.strict_mode else _SEVERITY_RANK.get(self.report_level, 0)
+        if threshold:
+            sources = [
+                source for source in sources
+                if _SEVERITY_RANK.get(source[2]['severity'], 0) >= threshold
+            ]
+        
+        regexes = []
+        literals = []
+        for i, (_, _, pattern_config) in enumerate(sources):
+            pattern = pattern_config['pattern']
+            if _LITERAL_PATTERN.match(pattern):
+                needle = _ESCAPED_CHAR.sub(r'\1', pattern)
+                literals.append((i, needle.lower().encode()))
+            else:
+                # Patterns run over UTF-8 bytes
+                regexes.append((i, _PATTERN_ENGINE.compile(pattern.encode(), _PATTERN_FLAGS)))
+        
+        columns = SimpleNamespace(
+            types=tuple(issue_type for issue_type, _, _ in sources),
+            names=tuple(name for _, name, _ in sources),
+            severities=tuple(config['severity'] for _, _, config in sources),
+            messages=tuple(config['message'] for _, _, config in sources),
+            suggestions=tuple(config['suggestion'] for _, _, config in sources)
+        )
+        # Leading SecurityIssue fields that are constant for every match of a pattern
+        columns.templates = tuple(zip(
+            columns.types, columns.names, columns.severities, columns.messages, columns.suggestions
+        ))
+        
+        return tuple(regexes), tuple(literals), columns
+    
+    def _find_literals(self, file_content: bytes):
+        """Yield (offset, pattern id, text) for every literal pattern occurrence"""
+        # bytes.lower() only folds ASCII, so offsets stay intact and a
+        # case-insensitive search reduces to bytes.find on a lowered copy
+        haystack = file_content.lower()
+        for pattern_id, needle in self._literal_patterns:
+            length = len(needle)
+            start = haystack.find(needle)
+            while start != -1:
+                yield start, pattern_id, file_content[start:start + length]
+                start = haystack.find(needle, start + length)
+    
     async def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Main execution logic for security analysis"""
         try:
             file_content = context.get('file_content', '')
             file_path = context.get('file_path', '')
             
-            # Perform security analysis
-            security_issues = await self._analyze_security(file_content, file_path)
+            # Content may arrive as raw bytes from disk; the scan works on bytes
+            if isinstance(file_content, str):
+                file_content = file_content.encode()
+            
+            # Unchanged files return the previous analysis without rescanning;
+            # the shared context is still updated for the other agents
+            cache_key = (file_path, hashlib.blake2b(file_content, digest_size=16).digest())
+            cached = self._scan_cache.get(cache_key)
+            if cached is not None:
+                self._scan_cache.move_to_end(cache_key)
+                result, buckets = cached
+                await self._update_shared_context(
+                    file_path, result['security_issues'], buckets, result['recommendations']
+                )
+                return _copy_result(result)
             
-            # Get ADK-specific security guidance using MCP tools
-            adk_guidance = await self._get_adk_security_guidance(file_content, security_issues)
+            # Run the CPU-bound pattern scan in a worker thread while the
+            # ADK-specific security guidance is fetched using MCP tools
+            loop = asyncio.get_running_loop()
+            security_issues, adk_guidance = await asyncio.gather(
+                loop.run_in_executor(None, lambda: list(self._analyze_security(file_content, file_path))),
+                self._get_adk_security_guidance(file_content, None)
+            )
+            
+            # Group issues by severity once for all downstream consumers
+            buckets = _bucket_by_severity(security_issues)
             
             # Generate recommendations
-            recommendations = self._generate_security_recommendations(security_issues, adk_guidance)
+            recommendations = self._generate_security_recommendations(buckets, adk_guidance)
             
             # Update shared context for coordination with other agents
-            await self._update_shared_context(file_path, security_issues, recommendations)
+            await self._update_shared_context(file_path, security_issues, buckets, recommendations)
             
-            return {
+            result = {
                 'success': True,
                 'agent': self.agent_name,
                 'analysis_type': 'security',
                 'security_issues': security_issues,
                 'recommendations': recommendations,
-                'severity_summary': self._generate_severity_summary(security_issues),
+                'severity_summary': self._generate_severity_summary(buckets),
                 'adk_guidance': adk_guidance
             }
             
+            # Don't pin a degraded result when MCP guidance was unavailable
+            if 'error' not in adk_guidance:
+                self._scan_cache[cache_key] = (result, buckets)
+                if len(self._scan_cache) > _SCAN_CACHE_SIZE:
+                    self._scan_cache.popitem(last=False)
+            
+            # Callers get their own copy, so editing it cannot alter the cached analysis
+            return _copy_result(result)
+            
         except Exception as e:
             return await self.handle_error(e, context)
     
-    async def _analyze_security(self, file_content: str, file_path: str) -> List[Dict[str, Any]]:
+    def _analyze_security(self, file_content: bytes, file_path: str) -> Iterator[SecurityIssue]:
         """Analyze file content for security issues"""
-        issues = []
+        # Every pattern scans the whole content, so overlapping matches of
+        # different patterns are all reported; results are merged back into
+        # file order (pattern order breaks ties)
+        matches = [(match.start(), pattern_id, match.group())
+                   for pattern_id, compiled in self._regex_patterns
+                   for match in compiled.finditer(file_content)]
+        matches.extend(self._find_literals(file_content))
+        matches.sort(key=itemgetter(0, 1))
         
-        # Check against security patterns
-        for pattern_config in self.security_patterns.get('patterns', []):
-            pattern = pattern_config['pattern']
-            matches = re.finditer(pattern, file_content, re.IGNORECASE | re.MULTILINE)
-            
-            for match in matches:
-                line_number = file_content[:match.start()].count('\n') + 1
-                
-                issue = {
-                    'type': 'security_pattern',
-                    'name': pattern_config['name'],
-                    'severity': pattern_config['severity'],
-                    'message': pattern_config['message'],
-                    'suggestion': pattern_config['suggestion'],
-                    'line_number': line_number,
-                    'matched_text': match.group(),
-                    'file_path': file_path
-                }
-                
-                issues.append(issue)
+        line_numbers = _line_numbers(file_content, [start for start, _, _ in matches])
         
-        # Additional security checks
-        issues.extend(await self._check_adk_security_patterns(file_content, file_path))
-        
-        return issues
+        # Only the line, matched text and path vary per match
+        templates = self._pat.templates
+        for (_, i, matched_text), line_number in zip(matches, line_numbers):
+            yield SecurityIssue(*templates[i], line_number, matched_text.decode('utf-8', 'replace'), file_path)
     
-    async def _check_adk_security_patterns(self, file_content: str, file_path: str) -> List[Dict[str, Any]]:
-        """Check for ADK-specific security patterns"""
-        issues = []
-        
-        # Check for insecure ADK patterns
-        adk_patterns = [
-            {
-                'pattern': r'\.unwrap\(\)',
-                'severity': 'medium',
-                'message': 'Use of unwrap() can cause panics',
-                'suggestion': 'Use proper error handling with Result types'
-            },
-            {
-                'pattern': r'unsafe\s*\{',
-                'severity': 'high',
-                'message': 'Unsafe code block detected',
-                'suggestion': 'Ensure unsafe code is properly reviewed and documented'
-            },
-            {
-                'pattern': r'std::process::Command::new\([^)]*\)\.arg\([^)]*user_input',
-                'severity': 'high',
-                'message': 'Potential command injection vulnerability',
-                'suggestion': 'Sanitize user input before using in commands'
-            }
-        ]
-        
-        for pattern_config in adk_patterns:
-            pattern = pattern_config['pattern']
-            matches = re.finditer(pattern, file_content, re.IGNORECASE | re.MULTILINE)
-            
-            for match in matches:
-                line_number = file_content[:match.start()].count('\n') + 1
-                
-                issue = {
-                    'type': 'adk_security_pattern',
-                    'name': f"adk-{pattern_config.get('name', 'security-issue')}",
-                    'severity': pattern_config['severity'],
-                    'message': pattern_config['message'],
-                    'suggestion': pattern_config['suggestion'],
-                    'line_number': line_number,
-                    'matched_text': match.group(),
-                    'file_path': file_path
-                }
-                
-                issues.append(issue)
-        
-        return issues
-    
-    async def _get_adk_security_guidance(self, file_content: str, security_issues: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _get_adk_security_guidance(self, file_content: bytes, security_issues: Optional[List[SecurityIssue]]) -> Mapping[str, Any]:
         """Get ADK-specific security guidance using MCP tools"""
         try:
             # Simulate MCP tool call (in real implementation, use actual MCP client)
-            # For this example, we'll return mock guidance
+            # For this example, the mock guidance is input-independent and shared
             
-            guidance = {
-                'best_practices': [
-                    'Use Result<T, E> for error handling instead of unwrap()',
-                    'Implement proper input validation for all user inputs',
-                    'Use ADK security middleware for authentication and authorization',
-                    'Follow ADK guidelines for secure data handling'
-                ],
-                'adk_specific_recommendations': [
-                    'Consider using ADK security utilities for common security tasks',
-                    'Implement ADK logging patterns for security events',
-                    'Use ADK configuration management for sensitive settings'
-                ],
-                'documentation_links': [
-                    'https://docs.google.com/adk/security/best-practices',
-                    'https://docs.google.com/adk/security/authentication',
-                    'https://docs.google.com/adk/security/data-protection'
-                ]
-            }
-            
-            # In real implementation:
+            # In real implementation (memoized per content digest, e.g.
+            # hashlib.blake2b(file_content, digest_size=8).digest()):
             # guidance = await self.mcp_client.call_tool(
             #     'get_best_practices',
             #     {'category': 'security', 'context': 'adk_project'}
             # )
             
-            return guidance
+            return _STATIC_GUIDANCE
             
         except Exception as e:
             print(f"Warning: Could not get ADK security guidance: {e}")
             return {'error': 'MCP guidance unavailable'}
     
-    def _generate_security_recommendations(self, security_issues: List[Dict[str, Any]], adk_guidance: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _generate_security_recommendations(self, buckets: Dict[str, List[SecurityIssue]], adk_guidance: Mapping[str, Any]) -> List[Dict[str, Any]]:
         """Generate actionable security recommendations"""
         recommendations = []
         
-        # Group issues by severity
-        high_severity_issues = [issue for issue in security_issues if issue['severity'] == 'high']
-        medium_severity_issues = [issue for issue in security_issues if issue['severity'] == 'medium']
-        low_severity_issues = [issue for issue in security_issues if issue['severity'] == 'low']
+        high_severity_issues = buckets['high']
+        medium_severity_issues = buckets['medium']
         
         # High priority recommendations
         if high_severity_issues:
@@ -279,25 +454,18 @@ class CustomSecurityAgent(BaseADKAgent):
         
         return recommendations
     
-    def _generate_severity_summary(self, security_issues: List[Dict[str, Any]]) -> Dict[str, int]:
+    def _generate_severity_summary(self, buckets: Dict[str, List[SecurityIssue]]) -> Dict[str, int]:
         """Generate summary of issues by severity"""
-        summary = {'high': 0, 'medium': 0, 'low': 0}
-        
-        for issue in security_issues:
-            severity = issue.get('severity', 'low')
-            if severity in summary:
-                summary[severity] += 1
-        
-        return summary
+        return {severity: len(buckets[severity]) for severity in _SEVERITIES}
     
-    async def _update_shared_context(self, file_path: str, security_issues: List[Dict[str, Any]], recommendations: List[Dict[str, Any]]):
+    async def _update_shared_context(self, file_path: str, security_issues: List[SecurityIssue], buckets: Dict[str, List[SecurityIssue]], recommendations: List[Dict[str, Any]]):
         """Update shared context for coordination with other agents"""
         # In real implementation, use actual context manager
         context_update = {
             'agent': self.agent_name,
             'analysis_type': 'security',
             'issues_found': len(security_issues),
-            'high_severity_count': len([i for i in security_issues if i['severity'] == 'high']),
+            'high_severity_count': len(buckets['high']),
             'recommendations_count': len(recommendations),
             'timestamp': 'current_timestamp'  # In real implementation, use actual timestamp
         }
@@ -380,7 +548,7 @@ fn main() {
     result = await agent.execute(context)
     
     print("Security Analysis Result:")
-    print(json.dumps(result, indent=2))
+    print(_dumps_pretty(result))
     
     return result
 
@@ -3,28 +3,85 @@
 Test Runner for ADK Agents
 
 Runs all ADK agent tests from the new location.
+Test modules run in parallel worker processes (-j/--jobs, default: CPU count).
 """
 
-import sys
+import argparse
+import io
 import os
+import sys
+import time
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Optional, Tuple
 
 # Add the parent directory to the path so we can import agents
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-def run_all_tests():
+# Test modules are listed explicitly so startup skips directory discovery;
+# add new test_*.py modules here
+TESTS = [
+    'tests.test_adk_architecture_agent',
+    'tests.test_adk_code_review_agent',
+    'tests.test_adk_docs_agent',
+    'tests.test_adk_project_assistant_agent',
+    'tests.test_custom_security_agent',
+]
+
+def _run_module(name: str) -> Tuple[str, int, int, int, int]:
+    """Run one test module and return its report, tests run, failures, errors and skips."""
+    stream = io.StringIO()
+    # The runner only wraps the buffer in the writeln stream TextTestResult expects
+    runner = unittest.TextTestRunner(stream=stream, verbosity=2)
+    result = unittest.TextTestResult(runner.stream, True, 2)
+    unittest.TestLoader().loadTestsFromName(name)(result)
+    result.printErrors()
+    return stream.getvalue(), result.testsRun, len(result.failures), len(result.errors), len(result.skipped)
+
+def run_all_tests(jobs: Optional[int] = None):
     """Run all ADK agent tests."""
-    # Discover and run tests
-    loader = unittest.TestLoader()
-    start_dir = os.path.dirname(os.path.abspath(__file__))
-    suite = loader.discover(start_dir, pattern='test_*.py')
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1:
+        # Load and run tests in this process
+        loader = unittest.TestLoader()
+        suite = loader.loadTestsFromNames(TESTS)
+        
+        runner = unittest.TextTestRunner(verbosity=2)
+        result = runner.run(suite)
+        
+        return result.wasSuccessful()
+    
+    # One module per worker; reports are printed in TESTS order
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=min(jobs, len(TESTS))) as pool:
+        reports = list(pool.map(_run_module, TESTS))
+    elapsed = time.perf_counter() - start
     
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    tests_run = failures = errors = skipped = 0
+    for report, run, failed, errored, skips in reports:
+        sys.stderr.write(report)
+        tests_run += run
+        failures += failed
+        errors += errored
+        skipped += skips
     
-    return result.wasSuccessful()
+    # Same summary format as unittest.TextTestRunner
+    sys.stderr.write("-" * 70 + "\n")
+    sys.stderr.write(f"Ran {tests_run} test{'s' if tests_run != 1 else ''} in {elapsed:.3f}s\n\n")
+    details = [
+        f"{label}={count}"
+        for label, count in (("failures", failures), ("errors", errors), ("skipped", skipped))
+        if count
+    ]
+    status = "FAILED" if failures or errors else "OK"
+    sys.stderr.write(f"{status} ({', '.join(details)})\n" if details else f"{status}\n")
+    return not (failures or errors)
 
 if __name__ == "__main__":
-    success = run_all_tests()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Run the ADK agent tests")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="worker processes (default: CPU count; 1 runs serially)")
+    args = parser.parse_args()
+    success = run_all_tests(args.jobs)
+    sys.exit(0 if success else 1)
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Scenario output capture for the script-style agent tests
+
+The architecture and code review test scripts run their scenarios
+concurrently. Each scenario prints into its own buffer, and the buffers
+are written out in declaration order once every scenario has finished.
+"""
+
+import io
+from contextvars import ContextVar
+from typing import Optional
+
+
+# Output buffer of the running test scenario
+_task_output: ContextVar[Optional[io.StringIO]] = ContextVar("_task_output", default=None)
+
+
+class TaskStdout(io.TextIOBase):
+    """sys.stdout stand-in that routes writes to the current scenario's buffer."""
+    
+    def __init__(self, fallback):
+        self._fallback = fallback
+    
+    def write(self, text: str) -> int:
+        return (_task_output.get() or self._fallback).write(text)
+
+
+async def captured(scenario) -> str:
+    """Run one test scenario and return everything it printed."""
+    buffer = io.StringIO()
+    _task_output.set(buffer)
+    await scenario
+    return buffer.getvalue()
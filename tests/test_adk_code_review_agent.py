@@ -6,16 +6,103 @@ This script tests the agent implementation with sample code and mock MCP respons
 """
 
 import asyncio
+import io
+import itertools
 import sys
 import os
+import unittest
+from contextlib import redirect_stdout
 
-# Add the current directory to Python path for imports
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agents'))
+# Make the agents directory importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'agents'))
+# The shared scenario output helpers live next to this file
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from adk_code_review_agent import ADKCodeReviewAgent, format_review_result, Priority, ReviewFinding
+from scenario_output import TaskStdout, captured
+
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+
+# Review, architecture and best-practice answers for the user service
+# samples, looked up by tool name in _TOOL_RESPONSES below
+_REVIEW_RUST_FILE_RESPONSE = {
+    "findings": [
+        {
+            "priority": "High",
+            "title": "Translation Support Missing",
+            "location": "Lines 3-4",
+            "description": "Hardcoded error messages should be externalized for translation",
+            "adk_impact": "Prevents proper internationalization and user experience localization",
+            "recommendation": "Use ADK translation APIs to externalize strings",
+            "example": 'return Err(translate!("errors.user_not_found"));'
+        },
+        {
+            "priority": "Medium",
+            "title": "Error Handling Enhancement",
+            "location": "Line 3",
+            "description": "Generic String error type could be more specific",
+            "adk_impact": "Reduces debugging capability and user-friendly error reporting",
+            "recommendation": "Use ADK-specific error types with proper context"
+        }
+    ],
+    "best_practices": {
+        "async_usage": True,
+        "error_handling": False,
+        "translation_support": False,
+        "code_organization": True
+    },
+    "references": [
+        "ADK Translation Guide",
+        "ADK Error Handling Best Practices"
+    ]
+}
+
+_VALIDATE_ARCHITECTURE_RESPONSE = {
+    "findings": [
+        {
+            "priority": "Medium",
+            "title": "Component Interface Design",
+            "location": "Function signature",
+            "description": "Function could benefit from more structured error types",
+            "adk_impact": "Affects error handling consistency across the application",
+            "recommendation": "Consider using Result<T, AdkError> pattern"
+        }
+    ],
+    "best_practices": {
+        "separation_of_concerns": True,
+        "dependency_management": True,
+        "component_organization": True
+    },
+    "references": [
+        "ADK Architecture Patterns Guide"
+    ]
+}
+
+_BEST_PRACTICES_RESPONSE = {
+    "compliance": {
+        "naming_conventions": True,
+        "documentation": False,
+        "testing": False
+    },
+    "recommendations": [
+        "Add comprehensive documentation comments",
+        "Implement unit tests for error scenarios"
+    ],
+    "references": [
+        "ADK Development Best Practices"
+    ]
+}
+
+
+_TOOL_RESPONSES = {
+    "review_rust_file": _REVIEW_RUST_FILE_RESPONSE,
+    "validate_architecture": _VALIDATE_ARCHITECTURE_RESPONSE,
+    "get_best_practices": _BEST_PRACTICES_RESPONSE
+}
 
 
 class MockMCPClient:
@@ -23,98 +110,23 @@ class MockMCPClient:
     
     def __init__(self, simulate_failure=False):
         self.simulate_failure = simulate_failure
+        self._calls = itertools.count(1)
         self.call_count = 0
     
     async def call_tool(self, server_name: str, tool_name: str, arguments: dict):
         """Mock MCP tool calls with realistic responses."""
-        self.call_count += 1
+        self.call_count = next(self._calls)
         
         if self.simulate_failure:
             raise Exception("Mock MCP server failure")
         
-        if tool_name == "review_rust_file":
-            return {
-                "findings": [
-                    {
-                        "priority": "High",
-                        "title": "Translation Support Missing",
-                        "location": "Lines 3-4",
-                        "description": "Hardcoded error messages should be externalized for translation",
-                        "adk_impact": "Prevents proper internationalization and user experience localization",
-                        "recommendation": "Use ADK translation APIs to externalize strings",
-                        "example": 'return Err(translate!("errors.user_not_found"));'
-                    },
-                    {
-                        "priority": "Medium",
-                        "title": "Error Handling Enhancement",
-                        "location": "Line 3",
-                        "description": "Generic String error type could be more specific",
-                        "adk_impact": "Reduces debugging capability and user-friendly error reporting",
-                        "recommendation": "Use ADK-specific error types with proper context"
-                    }
-                ],
-                "best_practices": {
-                    "async_usage": True,
-                    "error_handling": False,
-                    "translation_support": False,
-                    "code_organization": True
-                },
-                "references": [
-                    "ADK Translation Guide",
-                    "ADK Error Handling Best Practices"
-                ]
-            }
-        
-        elif tool_name == "validate_architecture":
-            return {
-                "findings": [
-                    {
-                        "priority": "Medium",
-                        "title": "Component Interface Design",
-                        "location": "Function signature",
-                        "description": "Function could benefit from more structured error types",
-                        "adk_impact": "Affects error handling consistency across the application",
-                        "recommendation": "Consider using Result<T, AdkError> pattern"
-                    }
-                ],
-                "best_practices": {
-                    "separation_of_concerns": True,
-                    "dependency_management": True,
-                    "component_organization": True
-                },
-                "references": [
-                    "ADK Architecture Patterns Guide"
-                ]
-            }
-        
-        elif tool_name == "get_best_practices":
-            return {
-                "compliance": {
-                    "naming_conventions": True,
-                    "documentation": False,
-                    "testing": False
-                },
-                "recommendations": [
-                    "Add comprehensive documentation comments",
-                    "Implement unit tests for error scenarios"
-                ],
-                "references": [
-                    "ADK Development Best Practices"
-                ]
-            }
-        
-        else:
+        response = _TOOL_RESPONSES.get(tool_name)
+        if response is None:
             return {"error": f"Unknown tool: {tool_name}"}
+        return response
 
 
-async def test_successful_review():
-    """Test successful code review with all MCP tools working."""
-    print("=== Testing Successful Code Review ===")
-    
-    mock_client = MockMCPClient(simulate_failure=False)
-    agent = ADKCodeReviewAgent(mock_client)
-    
-    sample_code = '''
+_SAMPLE_USER_LOOKUP = '''
 pub fn get_user(id: u32) -> Result<User, String> {
     if id == 0 {
         return Err("User not found".to_string());
@@ -123,45 +135,49 @@ pub fn get_user(id: u32) -> Result<User, String> {
     Ok(User { id, name: "Test User".to_string() })
 }
 '''
+
+
+async def test_successful_review():
+    """Test successful code review with all MCP tools working."""
+    print("=== Testing Successful Code Review ===")
     
-    result = await agent.review_file("src/user_service.rs", sample_code, {})
+    mock_client = MockMCPClient(simulate_failure=False)
+    agent = ADKCodeReviewAgent(mock_client)
+    
+    result = await agent.review_file("src/user_service.rs", _SAMPLE_USER_LOOKUP, {})
     formatted_output = format_review_result(result)
     
     print(formatted_output)
     print(f"\nMCP tool calls made: {mock_client.call_count}")
     print("✅ Successful review test completed\n")
+    return result
 
 
-async def test_mcp_failure_fallback():
-    """Test graceful degradation when MCP server fails."""
-    print("=== Testing MCP Failure Fallback ===")
-    
-    mock_client = MockMCPClient(simulate_failure=True)
-    agent = ADKCodeReviewAgent(mock_client)
-    
-    sample_code = '''
+_SAMPLE_RISKY_CODE = '''
 pub fn risky_function() -> String {
     let data = get_data().unwrap(); // This could panic!
     println!("Debug: processing {}", data);
     data.to_string()
 }
 '''
+
+
+async def test_mcp_failure_fallback():
+    """Test graceful degradation when MCP server fails."""
+    print("=== Testing MCP Failure Fallback ===")
+    
+    mock_client = MockMCPClient(simulate_failure=True)
+    agent = ADKCodeReviewAgent(mock_client)
     
-    result = await agent.review_file("src/risky_code.rs", sample_code, {})
+    result = await agent.review_file("src/risky_code.rs", _SAMPLE_RISKY_CODE, {})
     formatted_output = format_review_result(result)
     
     print(formatted_output)
     print("✅ Fallback test completed\n")
+    return result
 
 
-async def test_architectural_validation():
-    """Test architectural validation with complex code."""
-    print("=== Testing Architectural Validation ===")
-    
-    mock_client = MockMCPClient(simulate_failure=False)
-    agent = ADKCodeReviewAgent(mock_client)
-    
-    sample_code = '''
+_SAMPLE_USER_SERVICE = '''
 pub struct UserService {
     repository: Box<dyn UserRepository>,
 }
@@ -186,13 +202,25 @@ pub trait UserRepository {
     async fn create(&self, user_data: CreateUserRequest) -> Result<User, RepositoryError>;
 }
 '''
+
+
+async def test_architectural_validation():
+    """Test architectural validation with complex code."""
+    print("=== Testing Architectural Validation ===")
+    
+    mock_client = MockMCPClient(simulate_failure=False)
+    agent = ADKCodeReviewAgent(mock_client)
     
-    result = await agent.review_file("src/services/user_service.rs", sample_code, {})
+    result = await agent.review_file("src/services/user_service.rs", _SAMPLE_USER_SERVICE, {})
     formatted_output = format_review_result(result)
     
     print(formatted_output)
     print(f"MCP tool calls made: {mock_client.call_count}")
     print("✅ Architectural validation test completed\n")
+    return result
+
+
+_SIMPLE_CODE = "const VERSION: &str = \"1.0.0\";"
 
 
 async def test_edge_cases():
@@ -203,15 +231,68 @@ async def test_edge_cases():
     agent = ADKCodeReviewAgent(mock_client)
     
     # Test with empty file
-    result = await agent.review_file("src/empty.rs", "", {})
-    print("Empty file result:", result.summary)
+    empty_result = await agent.review_file("src/empty.rs", "", {})
+    print("Empty file result:", empty_result.summary)
     
     # Test with very simple file (no architectural patterns)
-    simple_code = "const VERSION: &str = \"1.0.0\";"
-    result = await agent.review_file("src/constants.rs", simple_code, {})
-    print("Simple file result:", result.summary)
+    simple_result = await agent.review_file("src/constants.rs", _SIMPLE_CODE, {})
+    print("Simple file result:", simple_result.summary)
     
     print("✅ Edge cases test completed\n")
+    return empty_result, simple_result
+
+
+class TestCodeReviewScenarios(unittest.IsolatedAsyncioTestCase):
+    """Each scenario as a unittest case, so run_tests.py can run them in its worker processes."""
+    
+    async def _run_scenario(self, scenario):
+        """Run one scenario with its output captured; return its result and output."""
+        with redirect_stdout(io.StringIO()) as output:
+            result = await scenario()
+        return result, output.getvalue()
+    
+    async def test_successful_review(self):
+        """Test that review_rust_file findings are reported in priority order."""
+        result, output = await self._run_scenario(test_successful_review)
+        
+        self.assertEqual(
+            [finding.title for finding in result.findings],
+            ["Translation Support Missing", "Error Handling Enhancement"]
+        )
+        self.assertEqual(result.priority, Priority.HIGH)
+        self.assertIn("**[High] Translation Support Missing**", output)
+        self.assertIn("⚠️ Translation Support", output)
+    
+    async def test_mcp_failure_fallback(self):
+        """Test that failed MCP tools are reported and the review falls back to no findings."""
+        result, output = await self._run_scenario(test_mcp_failure_fallback)
+        
+        for tool_name in ("review_rust_file", "get_best_practices"):
+            self.assertIn(f"Warning: {tool_name} MCP tool failed: Mock MCP server failure", output)
+        self.assertEqual(result.findings, [])
+        self.assertEqual(result.summary, "Reviewed `risky_code.rs` - No issues found. Code follows ADK best practices.")
+        self.assertNotIn("## Detailed Findings", output)
+    
+    async def test_architectural_validation(self):
+        """Test that architecture findings are added to the review of a service file."""
+        result, output = await self._run_scenario(test_architectural_validation)
+        
+        self.assertEqual(len(result.findings), 3)
+        self.assertEqual(result.findings[-1].title, "Architecture: Component Interface Design")
+        self.assertTrue(result.best_practices_status["separation_of_concerns"])
+        self.assertIn("3. **Medium Priority**: Architecture: Component Interface Design", output)
+    
+    async def test_edge_cases(self):
+        """Test the review summaries of an empty and a trivial file."""
+        (empty_result, simple_result), _ = await self._run_scenario(test_edge_cases)
+        
+        # The mock answers every file with the same canned findings
+        for result, file_name in ((empty_result, "empty.rs"), (simple_result, "constants.rs")):
+            self.assertEqual(
+                result.summary,
+                f"Reviewed `{file_name}` - 2 finding(s) identified. "
+                "Critical issues found, review recommended improvements."
+            )
 
 
 async def run_all_tests():
@@ -219,10 +300,20 @@ async def run_all_tests():
     print("🚀 Starting ADK Code Review Agent Tests\n")
     
     try:
-        await test_successful_review()
-        await test_mcp_failure_fallback()
-        await test_architectural_validation()
-        await test_edge_cases()
+        # Scenarios are independent, so run them concurrently and print
+        # their captured output in declaration order
+        stdout = sys.stdout
+        sys.stdout = TaskStdout(stdout)
+        try:
+            reports = await asyncio.gather(
+                captured(test_successful_review()),
+                captured(test_mcp_failure_fallback()),
+                captured(test_architectural_validation()),
+                captured(test_edge_cases())
+            )
+        finally:
+            sys.stdout = stdout
+        sys.stdout.write("".join(reports))
         
         print("🎉 All tests completed successfully!")
         
@@ -233,4 +324,8 @@ async def run_all_tests():
 
 
 if __name__ == "__main__":
+    # The scenarios only await in-memory mocks, so loop overhead dominates;
+    # use uvloop's event loop where it is installed
+    if HAS_UVLOOP:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(run_all_tests())
\ No newline at end of file
@@ -6,37 +6,155 @@ Comprehensive tests for the ADK Documentation Agent functionality,
 including MCP integration, context awareness, and error handling.
 """
 
+import functools
+import io
 import unittest
 import json
 import os
+import re
 import sys
+from contextlib import redirect_stdout
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
+from types import MappingProxyType
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_REPO_ROOT = os.path.abspath(os.path.join(_HERE, '..'))
 
 # Add the agent to the path for testing
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _HERE)
 
 try:
     # Import the renamed module
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agents'))
-    import adk_docs_agent
-    from adk_docs_agent import *
-    ADKDocumentationAgent = adk_docs_agent.ADKDocumentationAgent
+    sys.path.insert(0, os.path.join(_REPO_ROOT, 'agents'))
+    from adk_docs_agent import ADKDocumentationAgent, main
 except ImportError as e:
     print(f"Error importing ADK Documentation Agent: {e}")
     print("Make sure adk-docs-agent.py is in the same directory as this test file.")
     sys.exit(1)
 
-class TestADKDocumentationAgent(unittest.TestCase):
+# Config file locations, in lookup order; the agent config falls back to a
+# copy next to this file, the hook lives in the workspace above the repo
+_AGENT_CONFIG_CANDIDATES = (
+    os.path.join(_REPO_ROOT, 'config', 'adk_docs_agent.json'),
+    os.path.join(_HERE, 'adk_docs_agent.json')
+)
+_HOOK_CONFIG_CANDIDATES = (
+    os.path.join(_REPO_ROOT, '..', '.kiro', 'hooks', 'adk-docs-assistant.kiro.hook'),
+)
+
+# First existing candidate of each, or None; the configuration tests are
+# skipped when their file is absent
+_AGENT_CONFIG_PATH = next((p for p in _AGENT_CONFIG_CANDIDATES if os.path.exists(p)), None)
+_HOOK_CONFIG_PATH = next((p for p in _HOOK_CONFIG_CANDIDATES if os.path.exists(p)), None)
+
+# Parsed JSON config files, keyed by path, so each file is read once per process
+_CONFIG_CACHE = {}
+
+def _load_json_once(path):
+    """Load and parse a JSON file, reusing the parsed result on later calls."""
+    config = _CONFIG_CACHE.get(path)
+    if config is None:
+        with open(path, 'r') as f:
+            config = _CONFIG_CACHE[path] = json.load(f)
+    return config
+
+# Canned adk_query result standing in for the MCP server, shared by every
+# test so none of them depends on a live server
+_MCP_FIXTURE = MappingProxyType({
+    'content': MappingProxyType({
+        'answer': 'ADK components are created using the Component trait...',
+        'examples': (
+            'struct MyComponent;\nimpl Component for MyComponent { ... }',
+        ),
+        'best_practices': (
+            'Always implement proper error handling',
+            'Use dependency injection patterns'
+        ),
+        'references': (
+            'https://developers.google.com/adk/components',
+            'ADK Component Guide v2.1'
+        ),
+        'related_topics': (
+            'ADK Lifecycle Management',
+            'Component Testing'
+        )
+    })
+})
+
+# Markers the agent's responses share, declared once for every test that
+# looks for them
+_FALLBACK_MARKER = sys.intern("Fallback Mode")
+_RESPONSE_HEADER = sys.intern("ADK Documentation Response")
+_MCP_UNAVAILABLE = sys.intern("MCP server is currently unavailable")
+_MCP_SERVER_NAME = sys.intern("arkaft-mcp-google-adk")
+_ADK_DOCS_URL = sys.intern("developers.google.com/adk")
+
+class _Containing:
+    """Matcher that compares equal to any string containing the given substring."""
+    
+    def __init__(self, substring):
+        self.substring = substring
+    
+    def __eq__(self, other):
+        return isinstance(other, str) and self.substring in other
+    
+    def __repr__(self):
+        return f"<string containing {self.substring!r}>"
+
+class _AgentFixture:
+    """Mixin giving test classes one ADKDocumentationAgent per process (the tests only read it)."""
+    
+    _shared_agent = None
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up the shared agent on first use."""
+        super().setUpClass()
+        if _AgentFixture._shared_agent is None:
+            _AgentFixture._shared_agent = ADKDocumentationAgent()
+        cls.agent = _AgentFixture._shared_agent
+
+class TestADKDocumentationAgent(_AgentFixture, unittest.TestCase):
     """Test cases for the ADK Documentation Agent."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.agent = ADKDocumentationAgent()
-        self.sample_context = {
-            'currentFile': 'src/main.rs',
-            'projectStructure': ['src/', 'Cargo.toml', 'src/lib.rs', 'src/main.rs']
-        }
+    # Read-only fixtures, built once per process
+    SAMPLE_CONTEXT = MappingProxyType({
+        'currentFile': 'src/main.rs',
+        'projectStructure': ('src/', 'Cargo.toml', 'src/lib.rs', 'src/main.rs')
+    })
+    
+    RUST_CONTEXT = MappingProxyType({
+        'currentFile': 'src/components.rs',
+        'projectStructure': ('src/', 'src/components.rs')
+    })
+    
+    CARGO_CONTEXT = MappingProxyType({
+        'currentFile': 'Cargo.toml',
+        'projectStructure': ('Cargo.toml', 'src/')
+    })
+    
+    CARGO_MANIFEST_CONTEXT = MappingProxyType({
+        'currentFile': 'Cargo.toml',
+        'projectStructure': ('Cargo.toml',)
+    })
+    
+    # (current file, project structure, expected guidance)
+    CONTEXT_GUIDANCE_CASES = (
+        ('src/main.rs', ('src/',), "Rust-specific ADK examples"),
+        ('Cargo.toml', ('Cargo.toml',), "ADK configuration and dependencies"),
+        ('', ('src/lib.rs',), "architectural patterns")
+    )
+    
+    def assertAllIn(self, needles, haystack):
+        """Assert every needle occurs in haystack, scanning it once."""
+        # Longest first, so a needle that prefixes another does not hide it
+        pattern = re.compile("|".join(re.escape(n) for n in sorted(needles, key=len, reverse=True)))
+        found = {match.group(0) for match in pattern.finditer(haystack)}
+        # Overlapping needles can shadow each other in a single scan; only
+        # those fall back to a plain substring check
+        missing = [n for n in needles if n not in found and n not in haystack]
+        self.assertEqual(missing, [], f"Not found in {haystack!r}")
     
     def test_agent_initialization(self):
         """Test agent initialization and basic properties."""
@@ -49,74 +167,52 @@ class TestADKDocumentationAgent(unittest.TestCase):
     def test_create_agent_prompt_basic(self):
         """Test basic agent prompt creation."""
         user_query = "How do I set up ADK dependencies?"
-        prompt = self.agent.create_agent_prompt(user_query, self.sample_context)
+        prompt = self.agent.create_agent_prompt(user_query, self.SAMPLE_CONTEXT)
         
-        self.assertIn("ADK Documentation Assistant", prompt)
-        self.assertIn(user_query, prompt)
-        self.assertIn("src/main.rs", prompt)
-        self.assertIn("adk_query", prompt)
-        self.assertIn("arkaft-mcp-google-adk", prompt)
-    
-    def test_create_agent_prompt_with_rust_context(self):
-        """Test agent prompt creation with Rust file context."""
-        user_query = "How do I implement ADK components?"
-        context = {
-            'currentFile': 'src/components.rs',
-            'projectStructure': ['src/', 'src/components.rs']
-        }
-        
-        prompt = self.agent.create_agent_prompt(user_query, context)
-        
-        self.assertIn("Rust-specific ADK examples", prompt)
-        self.assertIn("src/components.rs", prompt)
-    
-    def test_create_agent_prompt_with_cargo_context(self):
-        """Test agent prompt creation with Cargo.toml context."""
-        user_query = "What ADK dependencies should I add?"
-        context = {
-            'currentFile': 'Cargo.toml',
-            'projectStructure': ['Cargo.toml', 'src/']
-        }
-        
-        prompt = self.agent.create_agent_prompt(user_query, context)
-        
-        self.assertIn("ADK configuration and dependencies", prompt)
-        self.assertIn("Cargo.toml", prompt)
+        self.assertAllIn([
+            "ADK Documentation Assistant",
+            user_query,
+            "src/main.rs",
+            "adk_query",
+            _MCP_SERVER_NAME
+        ], prompt)
+    
+    def test_create_agent_prompt_with_file_context(self):
+        """Test agent prompt creation with Rust file and Cargo.toml contexts."""
+        cases = (
+            ("How do I implement ADK components?", self.RUST_CONTEXT, "Rust-specific ADK examples"),
+            ("What ADK dependencies should I add?", self.CARGO_CONTEXT, "ADK configuration and dependencies")
+        )
+        for user_query, context, expected in cases:
+            with self.subTest(current_file=context['currentFile']):
+                prompt = self.agent.create_agent_prompt(user_query, context)
+                self.assertAllIn([expected, context['currentFile']], prompt)
     
     def test_generate_context_guidance(self):
         """Test context guidance generation."""
-        # Test with Rust file
-        guidance = self.agent._generate_context_guidance('src/main.rs', ['src/'])
-        self.assertIn("Rust-specific ADK examples", guidance)
-        
-        # Test with Cargo.toml
-        guidance = self.agent._generate_context_guidance('Cargo.toml', ['Cargo.toml'])
-        self.assertIn("ADK configuration and dependencies", guidance)
-        
-        # Test with lib.rs in structure
-        guidance = self.agent._generate_context_guidance('', ['src/lib.rs'])
-        self.assertIn("architectural patterns", guidance)
+        for current_file, project_structure, expected in self.CONTEXT_GUIDANCE_CASES:
+            with self.subTest(current_file=current_file, project_structure=project_structure):
+                guidance = self.agent._generate_context_guidance(current_file, project_structure)
+                self.assertIn(expected, guidance)
     
     def test_create_mcp_query_basic(self):
         """Test MCP query creation."""
         user_query = "How do I create ADK components?"
-        mcp_query = self.agent.create_mcp_query(user_query, self.sample_context)
+        mcp_query = self.agent.create_mcp_query(user_query, self.SAMPLE_CONTEXT)
         
-        self.assertEqual(mcp_query['tool'], 'adk_query')
-        self.assertIn('query', mcp_query['parameters'])
-        self.assertIn(user_query, mcp_query['parameters']['query'])
-        self.assertTrue(mcp_query['parameters']['include_examples'])
-        self.assertEqual(mcp_query['parameters']['version'], 'latest')
+        self.assertEqual(mcp_query, {
+            'tool': 'adk_query',
+            'parameters': {
+                'query': _Containing(user_query),
+                'include_examples': True,
+                'version': 'latest'
+            }
+        })
     
     def test_create_mcp_query_with_cargo_context(self):
         """Test MCP query creation with Cargo.toml context."""
         user_query = "ADK setup help"
-        context = {
-            'currentFile': 'Cargo.toml',
-            'projectStructure': ['Cargo.toml']
-        }
-        
-        mcp_query = self.agent.create_mcp_query(user_query, context)
+        mcp_query = self.agent.create_mcp_query(user_query, self.CARGO_MANIFEST_CONTEXT)
         query_text = mcp_query['parameters']['query']
         
         self.assertIn('dependencies', query_text)
@@ -126,37 +222,18 @@ class TestADKDocumentationAgent(unittest.TestCase):
     def test_format_documentation_response_complete(self):
         """Test documentation response formatting with complete MCP response."""
         user_query = "How do I use ADK components?"
-        mcp_response = {
-            'content': {
-                'answer': 'ADK components are created using the Component trait...',
-                'examples': [
-                    'struct MyComponent;\nimpl Component for MyComponent { ... }'
-                ],
-                'best_practices': [
-                    'Always implement proper error handling',
-                    'Use dependency injection patterns'
-                ],
-                'references': [
-                    'https://developers.google.com/adk/components',
-                    'ADK Component Guide v2.1'
-                ],
-                'related_topics': [
-                    'ADK Lifecycle Management',
-                    'Component Testing'
-                ]
-            }
-        }
+        response = self.agent.format_documentation_response(_MCP_FIXTURE, user_query)
         
-        response = self.agent.format_documentation_response(mcp_response, user_query)
-        
-        self.assertIn("ADK Documentation Response", response)
-        self.assertIn(user_query, response)
-        self.assertIn("ADK components are created", response)
-        self.assertIn("```rust", response)
-        self.assertIn("MyComponent", response)
-        self.assertIn("Best Practices", response)
-        self.assertIn("Official References", response)
-        self.assertIn("Related Topics", response)
+        self.assertAllIn([
+            _RESPONSE_HEADER,
+            user_query,
+            "ADK components are created",
+            "```rust",
+            "MyComponent",
+            "Best Practices",
+            "Official References",
+            "Related Topics"
+        ], response)
     
     def test_format_documentation_response_minimal(self):
         """Test documentation response formatting with minimal MCP response."""
@@ -180,20 +257,22 @@ class TestADKDocumentationAgent(unittest.TestCase):
         response = self.agent.format_documentation_response(mcp_response, user_query)
         
         # Should fall back to fallback response
-        self.assertIn("Fallback Mode", response)
-        self.assertIn("MCP server is currently unavailable", response)
+        self.assertIn(_FALLBACK_MARKER, response)
+        self.assertIn(_MCP_UNAVAILABLE, response)
     
     def test_create_fallback_response(self):
         """Test fallback response creation."""
         user_query = "How do I use ADK?"
         fallback = self.agent._create_fallback_response(user_query)
         
-        self.assertIn("Fallback Mode", fallback)
-        self.assertIn(user_query, fallback)
-        self.assertIn("MCP server is currently unavailable", fallback)
-        self.assertIn("Official Documentation", fallback)
-        self.assertIn("developers.google.com/adk", fallback)
-        self.assertIn("Common ADK Patterns", fallback)
+        self.assertAllIn([
+            _FALLBACK_MARKER,
+            user_query,
+            _MCP_UNAVAILABLE,
+            "Official Documentation",
+            _ADK_DOCS_URL,
+            "Common ADK Patterns"
+        ], fallback)
     
     def test_handle_error(self):
         """Test error handling."""
@@ -202,19 +281,30 @@ class TestADKDocumentationAgent(unittest.TestCase):
         
         error_response = self.agent.handle_error(test_error, user_query)
         
-        self.assertIn("Error Notice", error_response)
-        self.assertIn("Test error message", error_response)
-        self.assertIn(user_query, error_response)
-        self.assertIn("Troubleshooting Steps", error_response)
-        self.assertIn("arkaft-mcp-google-adk", error_response)
-        self.assertIn("Alternative Resources", error_response)
+        self.assertAllIn([
+            "Error Notice",
+            "Test error message",
+            user_query,
+            "Troubleshooting Steps",
+            _MCP_SERVER_NAME,
+            "Alternative Resources"
+        ], error_response)
 
-class TestADKDocumentationAgentIntegration(unittest.TestCase):
+class TestADKDocumentationAgentIntegration(_AgentFixture, unittest.TestCase):
     """Integration tests for the ADK Documentation Agent."""
     
-    def setUp(self):
-        """Set up integration test fixtures."""
-        self.agent = ADKDocumentationAgent()
+    def test_query_round_trip(self):
+        """Test a query built by the agent, then its canned MCP answer formatted."""
+        # The agent makes no MCP calls itself, so the fixture stands in for the reply
+        user_query = "How do I use ADK components?"
+        
+        mcp_query = self.agent.create_mcp_query(user_query, {'currentFile': 'src/main.rs'})
+        response = self.agent.format_documentation_response(_MCP_FIXTURE, user_query)
+        
+        self.assertEqual(mcp_query['tool'], 'adk_query')
+        self.assertEqual(mcp_query['parameters']['query'], f"{user_query} rust implementation api")
+        self.assertIn("ADK components are created", response)
+        self.assertNotIn(_FALLBACK_MARKER, response)
     
     @patch('sys.argv', ['adk-docs-agent.py', 'How', 'do', 'I', 'use', 'ADK?'])
     @patch.dict(os.environ, {
@@ -223,49 +313,46 @@ class TestADKDocumentationAgentIntegration(unittest.TestCase):
     })
     def test_main_with_arguments(self):
         """Test main function with command line arguments."""
-        with patch('builtins.print') as mock_print:
-            # Import and run main
-            main = adk_docs_agent.main
+        with redirect_stdout(io.StringIO()) as buffer:
             main()
-            
-            # Check that output was generated
-            mock_print.assert_called()
-            call_args = [call[0][0] for call in mock_print.call_args_list]
-            output = '\n'.join(call_args)
-            
-            self.assertIn("Generated Agent Prompt", output)
-            self.assertIn("How do I use ADK", output)
+        output = buffer.getvalue()
+        
+        # Check that output was generated
+        self.assertTrue(output)
+        self.assertIn("Generated Agent Prompt", output)
+        self.assertIn("How do I use ADK", output)
     
     @patch('sys.argv', ['adk-docs-agent.py'])
     def test_main_without_arguments(self):
         """Test main function without arguments (usage message)."""
-        with patch('builtins.print') as mock_print:
-            main = adk_docs_agent.main
+        with redirect_stdout(io.StringIO()) as buffer:
             main()
-            
-            call_args = [call[0][0] for call in mock_print.call_args_list]
-            output = '\n'.join(call_args)
-            
-            self.assertIn("ADK Documentation Agent", output)
-            self.assertIn("Usage:", output)
-            self.assertIn("Example:", output)
+        output = buffer.getvalue()
+        
+        self.assertIn("ADK Documentation Agent", output)
+        self.assertIn("Usage:", output)
+        self.assertIn("Example:", output)
+
+class _ConfigTestBase(unittest.TestCase):
+    """Shared access to the parsed config files for the configuration tests."""
+    
+    @functools.cached_property
+    def agent_config(self):
+        """Parsed agent configuration file."""
+        return _load_json_once(_AGENT_CONFIG_PATH)
+    
+    @functools.cached_property
+    def hook_config(self):
+        """Parsed hook configuration file."""
+        return _load_json_once(_HOOK_CONFIG_PATH)
 
-class TestADKDocumentationAgentConfiguration(unittest.TestCase):
+class TestADKDocumentationAgentConfiguration(_ConfigTestBase):
     """Test configuration file validation."""
     
+    @unittest.skipUnless(_AGENT_CONFIG_PATH, "agent config not present")
     def test_agent_configuration_file_exists(self):
         """Test that the agent configuration file exists and is valid."""
-        config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'adk_docs_agent.json')
-        
-        # Check if running from test directory
-        if not os.path.exists(config_path):
-            config_path = os.path.join(os.path.dirname(__file__), 'adk_docs_agent.json')
-        
-        self.assertTrue(os.path.exists(config_path), 
-                       f"Configuration file not found at {config_path}")
-        
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        config = self.agent_config
         
         # Validate required configuration fields
         self.assertIn('name', config)
@@ -280,23 +367,13 @@ class TestADKDocumentationAgentConfiguration(unittest.TestCase):
         self.assertIn('adk_query', mcp_config['primary_tools'])
         self.assertTrue(mcp_config['fallback_enabled'])
 
-class TestADKDocumentationHookConfiguration(unittest.TestCase):
+class TestADKDocumentationHookConfiguration(_ConfigTestBase):
     """Test hook configuration file validation."""
     
+    @unittest.skipUnless(_HOOK_CONFIG_PATH, "hook config not present")
     def test_hook_configuration_file_exists(self):
         """Test that the hook configuration file exists and is valid."""
-        hook_path = os.path.join(os.path.dirname(__file__), '..', '..', '.kiro', 'hooks', 'adk-docs-assistant.kiro.hook')
-        
-        # Check if running from test directory
-        if not os.path.exists(hook_path):
-            hook_path = os.path.join(os.path.dirname(__file__), 
-                                   '../../.kiro/hooks/adk-docs-assistant.kiro.hook')
-        
-        self.assertTrue(os.path.exists(hook_path), 
-                       f"Hook configuration file not found at {hook_path}")
-        
-        with open(hook_path, 'r') as f:
-            hook_config = json.load(f)
+        hook_config = self.hook_config
         
         # Validate required hook fields
         self.assertTrue(hook_config['enabled'])
@@ -311,35 +388,36 @@ class TestADKDocumentationHookConfiguration(unittest.TestCase):
         self.assertIn('cargoTomlDependencies', project_detection)
         self.assertIn('google-adk', project_detection['cargoTomlDependencies'])
 
-def run_tests():
-    """Run all tests with detailed output."""
-    # Create test suite
-    test_suite = unittest.TestSuite()
-    
-    # Add test cases
-    test_classes = [
-        TestADKDocumentationAgent,
-        TestADKDocumentationAgentIntegration,
-        TestADKDocumentationAgentConfiguration,
-        TestADKDocumentationHookConfiguration
-    ]
-    
-    for test_class in test_classes:
-        tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        test_suite.addTests(tests)
-    
-    # Run tests with verbose output
-    runner = unittest.TextTestRunner(verbosity=2, buffer=True)
+def run_tests(fast=None):
+    """Run all tests with detailed output.
+    
+    With fast (default: the TEST_FAST=1 environment variable), output is not
+    captured and the run stops at the first failure.
+    """
+    if fast is None:
+        fast = os.environ.get('TEST_FAST') == '1'
+    
+    # Every TestCase class in this module
+    test_suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+    
+    if fast:
+        runner = unittest.TextTestRunner(verbosity=1, buffer=False, failfast=True)
+    else:
+        runner = unittest.TextTestRunner(verbosity=2, buffer=True)
     result = runner.run(test_suite)
     
-    # Print summary
-    print(f"\n{'='*50}")
-    print(f"Test Summary:")
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(f"Success rate: {((result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun * 100):.1f}%")
-    print(f"{'='*50}")
+    tests_run = result.testsRun
+    failures = len(result.failures)
+    errors = len(result.errors)
+    
+    # Print a machine-readable summary
+    print(json.dumps({
+        'run': tests_run,
+        'failures': failures,
+        'errors': errors,
+        'skipped': len(result.skipped),
+        'success_rate': round((tests_run - failures - errors) / max(1, tests_run), 4)
+    }))
     
     return result.wasSuccessful()
 
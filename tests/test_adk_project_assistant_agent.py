@@ -13,12 +13,13 @@ import sys
 import asyncio
 from unittest.mock import Mock, patch, MagicMock, AsyncMock
 from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
 
-# Add the agent to the path for testing
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Make the agents directory importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'agents'))
 
 try:
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agents'))
     from adk_project_assistant_agent import (
         ADKProjectAssistantAgent,
         AssistanceType,
@@ -28,7 +29,9 @@ try:
         CodeExample,
         TroubleshootingGuidance,
         TaskBreakdown,
+        TaskStep,
         ProjectAssistanceResult,
+        ProjectContext,
         format_project_assistance_result
     )
 except ImportError as e:
@@ -37,18 +40,95 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Answers for each MCP tool the project assistant calls, read-only so one
+# mapping can back every test's mock client
+_MCP_RESPONSES = MappingProxyType({
+    "adk_query": {
+        "answer": "ADK components are building blocks...",
+        "examples": [
+            {
+                "title": "Basic Component",
+                "code": "impl Component for MyComponent { ... }",
+                "description": "Simple component",
+                "language": "rust",
+                "explanation": "Basic implementation",
+                "best_practices": ["Use proper error handling"],
+                "related_patterns": ["Component Pattern"]
+            }
+        ],
+        "best_practices": ["Follow ADK patterns"],
+        "references": ["ADK Guide"],
+        "setup_steps": [
+            {
+                "title": "Initialize Project",
+                "command": "cargo new project",
+                "description": "Create new project"
+            }
+        ]
+    },
+    "get_best_practices": {
+        "recommendations": ["Use dependency injection", "Implement error handling"],
+        "references": ["Best Practices Guide"],
+        "prerequisites": ["Rust knowledge"],
+        "implementation_guidance": ["Start simple", "Add complexity gradually"]
+    },
+    "validate_architecture": {
+        "recommended_approach": "Component-based architecture",
+        "findings": [],
+        "references": ["Architecture Guide"]
+    },
+    "review_rust_file": {
+        "findings": [],
+        "best_practices": {"error_handling": True},
+        "references": ["Code Review Guide"],
+        "common_issues": ["Missing error handling"],
+        "solutions": [
+            {
+                "issue": "Compilation Error",
+                "solution": "Check dependencies",
+                "command": "cargo check"
+            }
+        ]
+    }
+})
+_UNKNOWN_TOOL_RESPONSE = {"error": "Unknown tool"}
+
+
+async def _mock_call_tool(server_name, tool_name, arguments):
+    """Mock MCP tool calls with canned responses."""
+    return _MCP_RESPONSES.get(tool_name, _UNKNOWN_TOOL_RESPONSE)
+
+
+# Disk I/O and formatting-heavy classes; TEST_SKIP_SLOW=1 skips them for
+# quick local runs
+_slow = unittest.skipIf(os.environ.get('TEST_SKIP_SLOW') == '1', "slow test skipped with TEST_SKIP_SLOW=1")
+
+
+def _make_mock_mcp():
+    """Build a fresh mock MCP client wired to the canned responses.
+    
+    call_tool is the only attribute the agent uses, so the spec rejects
+    anything else. Each fixture gets its own mock: copies of one template
+    would share its child mocks, so swapping call_tool would leak.
+    """
+    client = AsyncMock(spec_set=("call_tool",))
+    client.call_tool = _mock_call_tool
+    return client
+
+
 class TestADKProjectAssistantAgent(unittest.TestCase):
     """Test cases for the ADK Project Assistant Agent."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.mock_mcp_client = AsyncMock()
-        self.agent = ADKProjectAssistantAgent(self.mock_mcp_client)
-        self.sample_context = {
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by every test (these tests never call MCP)."""
+        cls.mock_mcp_client = _make_mock_mcp()
+        cls.agent = ADKProjectAssistantAgent(cls.mock_mcp_client)
+        cls.sample_context = ProjectContext.from_dict({
             'currentFile': 'src/main.rs',
             'projectStructure': ['src/', 'Cargo.toml', 'src/lib.rs', 'src/main.rs'],
             'projectType': 'adk'
-        }
+        })
     
     def test_agent_initialization(self):
         """Test agent initialization and basic properties."""
@@ -56,74 +136,68 @@ class TestADKProjectAssistantAgent(unittest.TestCase):
         self.assertIsNotNone(self.agent.mcp_client)
         self.assertEqual(self.agent.project_context, {})
     
-    def test_determine_assistance_type_project_setup(self):
-        """Test assistance type determination for project setup."""
-        test_cases = [
-            ("How do I set up a new ADK project?", AssistanceType.PROJECT_SETUP),
-            ("Create a new ADK application", AssistanceType.PROJECT_SETUP), 
-            ("Initialize ADK project", AssistanceType.PROJECT_SETUP),
-            ("Start new project with ADK", AssistanceType.PROJECT_SETUP)
-        ]
-        
-        for request, expected_type in test_cases:
-            assistance_type = self.agent._determine_assistance_type(request, self.sample_context)
-            # Debug output to see what's happening
-            if assistance_type != expected_type:
-                print(f"DEBUG: Request '{request}' returned {assistance_type}, expected {expected_type}")
-            self.assertEqual(assistance_type, expected_type, 
-                           f"Request '{request}' should return {expected_type}, got {assistance_type}")
-    
-    def test_determine_assistance_type_architecture(self):
-        """Test assistance type determination for architecture guidance."""
-        test_cases = [
-            "What's the best architecture for my service?",
-            "How should I design my components?",
-            "ADK architectural patterns",
-            "Component organization structure"
-        ]
-        
-        for request in test_cases:
-            assistance_type = self.agent._determine_assistance_type(request, self.sample_context)
-            self.assertEqual(assistance_type, AssistanceType.ARCHITECTURE_GUIDANCE)
-    
-    def test_determine_assistance_type_code_examples(self):
-        """Test assistance type determination for code examples."""
-        test_cases = [
-            "Show me how to implement a component",
-            "Code example for ADK service",
-            "How to implement error handling",
-            "Sample ADK application code"
-        ]
+    # (request, expected assistance type)
+    ASSISTANCE_TYPE_CASES = (
+        ("How do I set up a new ADK project?", AssistanceType.PROJECT_SETUP),
+        ("Create a new ADK application", AssistanceType.PROJECT_SETUP),
+        ("Initialize ADK project", AssistanceType.PROJECT_SETUP),
+        ("Start new project with ADK", AssistanceType.PROJECT_SETUP),
+        ("What's the best architecture for my service?", AssistanceType.ARCHITECTURE_GUIDANCE),
+        ("How should I design my components?", AssistanceType.ARCHITECTURE_GUIDANCE),
+        ("ADK architectural patterns", AssistanceType.ARCHITECTURE_GUIDANCE),
+        ("Component organization structure", AssistanceType.ARCHITECTURE_GUIDANCE),
+        ("Show me how to implement a component", AssistanceType.CODE_EXAMPLES),
+        ("Code example for ADK service", AssistanceType.CODE_EXAMPLES),
+        ("How to implement error handling", AssistanceType.CODE_EXAMPLES),
+        ("Sample ADK application code", AssistanceType.CODE_EXAMPLES),
+        ("My ADK app has an error", AssistanceType.TROUBLESHOOTING),
+        ("Getting issues when running", AssistanceType.TROUBLESHOOTING),
+        ("Debug compilation problems", AssistanceType.TROUBLESHOOTING),
+        ("Fix runtime errors", AssistanceType.TROUBLESHOOTING),
+        ("Break down building a user service", AssistanceType.TASK_BREAKDOWN),
+        ("Step-by-step guide for implementation", AssistanceType.TASK_BREAKDOWN),
+        ("Plan for creating ADK components", AssistanceType.TASK_BREAKDOWN),
+        ("Roadmap for project development", AssistanceType.TASK_BREAKDOWN)
+    )
+    
+    def test_determine_assistance_type(self):
+        """Test assistance type determination for every assistance category."""
+        for request, expected_type in self.ASSISTANCE_TYPE_CASES:
+            with self.subTest(request=request):
+                assistance_type = self.agent._determine_assistance_type(request, self.sample_context)
+                self.assertEqual(assistance_type, expected_type, 
+                               f"Request '{request}' should return {expected_type}, got {assistance_type}")
+    
+    def test_project_context_from_dict(self):
+        """Test ProjectContext parsing and round-tripping."""
+        raw = {
+            'currentFile': 'src/lib.rs',
+            'projectStructure': ['src/', 'Cargo.toml'],
+            'extra': {'nested': True}
+        }
+        context = ProjectContext.from_dict(raw)
         
-        for request in test_cases:
-            assistance_type = self.agent._determine_assistance_type(request, self.sample_context)
-            self.assertEqual(assistance_type, AssistanceType.CODE_EXAMPLES)
-    
-    def test_determine_assistance_type_troubleshooting(self):
-        """Test assistance type determination for troubleshooting."""
-        test_cases = [
-            "My ADK app has an error",
-            "Getting issues when running", 
-            "Debug compilation problems",
-            "Fix runtime errors"
-        ]
+        self.assertEqual(context.to_dict(), raw)
+        self.assertEqual(hash(context), hash(ProjectContext.from_dict(dict(raw))))
+        self.assertEqual(ProjectContext.from_dict(None), ProjectContext())
+    
+    def test_project_context_to_dict_is_lossless_copy(self):
+        """Test that to_dict keeps non-JSON values and returns independent copies."""
+        raw = {'root': Path('src'), 'features': ('async',), 'extra': {'nested': True}}
+        context = ProjectContext.from_dict(raw)
+        raw['extra']['nested'] = False
         
-        for request in test_cases:
-            assistance_type = self.agent._determine_assistance_type(request, self.sample_context)
-            self.assertEqual(assistance_type, AssistanceType.TROUBLESHOOTING)
-    
-    def test_determine_assistance_type_task_breakdown(self):
-        """Test assistance type determination for task breakdown."""
-        test_cases = [
-            "Break down building a user service",
-            "Step-by-step guide for implementation",
-            "Plan for creating ADK components",
-            "Roadmap for project development"
-        ]
+        first = context.to_dict()
+        self.assertEqual(first, {'root': Path('src'), 'features': ('async',), 'extra': {'nested': True}})
         
-        for request in test_cases:
-            assistance_type = self.agent._determine_assistance_type(request, self.sample_context)
-            self.assertEqual(assistance_type, AssistanceType.TASK_BREAKDOWN)
+        first['extra']['nested'] = None
+        self.assertEqual(context.to_dict()['extra'], {'nested': True})
+    
+    def test_assistance_type_display(self):
+        """Test precomputed display titles on AssistanceType members."""
+        self.assertEqual(AssistanceType.PROJECT_SETUP.display, "Project Setup")
+        self.assertEqual(AssistanceType.CODE_EXAMPLES.value, "code_examples")
+        self.assertIs(AssistanceType("task_breakdown"), AssistanceType.TASK_BREAKDOWN)
     
     def test_enhance_query_for_type(self):
         """Test query enhancement based on assistance type."""
@@ -173,76 +247,22 @@ class TestADKProjectAssistantAgent(unittest.TestCase):
 class TestADKProjectAssistantAgentAsync(unittest.IsolatedAsyncioTestCase):
     """Async test cases for the ADK Project Assistant Agent."""
     
-    async def asyncSetUp(self):
-        """Set up async test fixtures."""
-        self.mock_mcp_client = AsyncMock()
-        self.agent = ADKProjectAssistantAgent(self.mock_mcp_client)
-        self.sample_context = {
+    @classmethod
+    def setUpClass(cls):
+        """Set up the immutable context shared by every test."""
+        super().setUpClass()
+        cls.sample_context = ProjectContext.from_dict({
             'currentFile': 'src/main.rs',
             'projectStructure': ['src/', 'Cargo.toml'],
             'projectType': 'adk'
-        }
-        
-        # Set up mock responses
-        self.setup_mock_responses()
-    
-    def setup_mock_responses(self):
-        """Set up mock MCP responses."""
-        async def mock_call_tool(server_name, tool_name, arguments):
-            if tool_name == "adk_query":
-                return {
-                    "answer": "ADK components are building blocks...",
-                    "examples": [
-                        {
-                            "title": "Basic Component",
-                            "code": "impl Component for MyComponent { ... }",
-                            "description": "Simple component",
-                            "language": "rust",
-                            "explanation": "Basic implementation",
-                            "best_practices": ["Use proper error handling"],
-                            "related_patterns": ["Component Pattern"]
-                        }
-                    ],
-                    "best_practices": ["Follow ADK patterns"],
-                    "references": ["ADK Guide"],
-                    "setup_steps": [
-                        {
-                            "title": "Initialize Project",
-                            "command": "cargo new project",
-                            "description": "Create new project"
-                        }
-                    ]
-                }
-            elif tool_name == "get_best_practices":
-                return {
-                    "recommendations": ["Use dependency injection", "Implement error handling"],
-                    "references": ["Best Practices Guide"],
-                    "prerequisites": ["Rust knowledge"],
-                    "implementation_guidance": ["Start simple", "Add complexity gradually"]
-                }
-            elif tool_name == "validate_architecture":
-                return {
-                    "recommended_approach": "Component-based architecture",
-                    "findings": [],
-                    "references": ["Architecture Guide"]
-                }
-            elif tool_name == "review_rust_file":
-                return {
-                    "findings": [],
-                    "best_practices": {"error_handling": True},
-                    "references": ["Code Review Guide"],
-                    "common_issues": ["Missing error handling"],
-                    "solutions": [
-                        {
-                            "issue": "Compilation Error",
-                            "solution": "Check dependencies",
-                            "command": "cargo check"
-                        }
-                    ]
-                }
-            return {"error": "Unknown tool"}
-        
-        self.mock_mcp_client.call_tool = mock_call_tool
+        })
+    
+    async def asyncSetUp(self):
+        """Set up async test fixtures."""
+        # The agent and client stay per test: tests swap call_tool and
+        # inspect the agent's in-flight and result caches
+        self.mock_mcp_client = _make_mock_mcp()
+        self.agent = ADKProjectAssistantAgent(self.mock_mcp_client)
     
     async def test_query_adk_documentation(self):
         """Test ADK documentation querying."""
@@ -298,6 +318,23 @@ class TestADKProjectAssistantAgentAsync(unittest.IsolatedAsyncioTestCase):
         self.assertIn("best_practices", mcp_data)
         self.assertIn("architecture_validation", mcp_data)
     
+    async def test_gather_comprehensive_data_fails_open(self):
+        """Test that a tool helper raising does not discard the other results."""
+        async def broken_insights(user_request, project_context):
+            raise RuntimeError("unexpected")
+        
+        self.agent._get_code_insights = broken_insights
+        
+        mcp_data = await self.agent._gather_comprehensive_data(
+            "Fix runtime errors",
+            self.sample_context,
+            AssistanceType.TROUBLESHOOTING
+        )
+        
+        self.assertIn("adk_query", mcp_data)
+        self.assertIn("best_practices", mcp_data)
+        self.assertNotIn("code_insights", mcp_data)
+    
     async def test_generate_project_setup_guidance(self):
         """Test project setup guidance generation."""
         mcp_data = {
@@ -380,6 +417,21 @@ class TestADKProjectAssistantAgentAsync(unittest.IsolatedAsyncioTestCase):
         custom_example = next((ex for ex in examples if ex.title == "Custom Example"), None)
         self.assertIsNotNone(custom_example)
         self.assertEqual(custom_example.code, "custom code")
+        
+        # Built-in examples are loaded from the resources directory
+        self.assertEqual(examples[0].title, "Basic ADK Component")
+        self.assertEqual(examples[2].language, "toml")
+    
+    async def test_generate_code_examples_are_not_shared(self):
+        """Test that mutating returned built-in examples does not affect later requests."""
+        first = self.agent._generate_code_examples("Show me examples", self.sample_context, {})
+        first[0].title = "Changed"
+        first[0].best_practices.append("caller note")
+        
+        second = self.agent._generate_code_examples("Show me examples", self.sample_context, {})
+        
+        self.assertEqual(second[0].title, "Basic ADK Component")
+        self.assertNotIn("caller note", second[0].best_practices)
     
     async def test_generate_troubleshooting_guidance(self):
         """Test troubleshooting guidance generation."""
@@ -424,6 +476,22 @@ class TestADKProjectAssistantAgentAsync(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(guidance.complexity_level, "Medium")
         self.assertTrue(len(guidance.steps) > 0)
         self.assertTrue(len(guidance.prerequisites) > 0)
+        self.assertIsInstance(guidance.steps[0], TaskStep)
+        self.assertEqual(guidance.steps[0].phase, "Planning")
+    
+    async def test_generate_general_guidance_returns_markdown(self):
+        """Test that general guidance is returned as rendered markdown."""
+        guidance = self.agent._generate_general_guidance(
+            "General ADK question",
+            self.sample_context,
+            {"adk_query": {"answer": "Use components"}, "best_practices": {"recommendations": ["Test"]}}
+        )
+        
+        self.assertIsInstance(guidance, str)
+        self.assertTrue(guidance.startswith("## ADK Project Guidance"))
+        self.assertIn("**Your Request**: General ADK question", guidance)
+        self.assertIn("Use components", guidance)
+        self.assertIn("- Test", guidance)
     
     async def test_provide_assistance_project_setup(self):
         """Test complete assistance provision for project setup."""
@@ -452,7 +520,28 @@ class TestADKProjectAssistantAgentAsync(unittest.IsolatedAsyncioTestCase):
         self.assertIsInstance(result.primary_guidance, list)
         self.assertTrue(len(result.primary_guidance) > 0)
         self.assertIsInstance(result.primary_guidance[0], CodeExample)
-    
+
+    async def test_compile_assistance_result_deduplicates_in_order(self):
+        """Test that collected resources are deduplicated with stable ordering."""
+        mcp_data = {
+            "adk_query": {"references": ["ADK Guide", "ADK Architecture Guide"]},
+            "best_practices": {"references": ["ADK Guide", "Best Practices Guide"]}
+        }
+
+        result = await self.agent._compile_assistance_result(
+            AssistanceType.GENERAL_GUIDANCE, "Help", "guidance", mcp_data
+        )
+
+        self.assertEqual(result.references, (
+            "Google ADK Official Documentation",
+            "ADK Rust API Reference",
+            "ADK Architecture Guide",
+            "ADK Guide",
+            "Best Practices Guide"
+        ))
+        self.assertIsInstance(result.additional_resources, tuple)
+        self.assertIsInstance(result.best_practices, tuple)
+
     async def test_provide_assistance_auto_detection(self):
         """Test assistance provision with automatic type detection."""
         result = await self.agent.provide_assistance(
@@ -477,14 +566,124 @@ class TestADKProjectAssistantAgentAsync(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result.assistance_type, expected_type)
         self.assertIn("Fallback ADK Project Assistance", result.primary_guidance)
         self.assertIn("MCP server connection failed", result.primary_guidance)
+
+    async def test_concurrent_identical_queries_are_coalesced(self):
+        """Test that identical in-flight MCP calls share a single request."""
+        call_count = 0
+
+        async def slow_call_tool(server_name, tool_name, arguments):
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return {"answer": "shared"}
+
+        self.mock_mcp_client.call_tool = slow_call_tool
+
+        results = await asyncio.gather(*(
+            self.agent._query_adk_documentation("How to create components?", AssistanceType.CODE_EXAMPLES)
+            for _ in range(3)
+        ))
+
+        self.assertEqual(call_count, 1)
+        self.assertTrue(all(result == {"answer": "shared"} for result in results))
+        self.assertEqual(self.agent._inflight, {})
+
+    async def test_cancelled_waiter_leaves_shared_call_running(self):
+        """Test that cancelling a coalesced waiter does not cancel the first caller's call."""
+        release = asyncio.Event()
+        
+        async def gated_call_tool(server_name, tool_name, arguments):
+            await release.wait()
+            return {"answer": "shared"}
+        
+        self.mock_mcp_client.call_tool = gated_call_tool
+        
+        leader = asyncio.create_task(self.agent._call_tool_coalesced("adk_query", {"query": "q"}))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(self.agent._call_tool_coalesced("adk_query", {"query": "q"}))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        
+        self.assertEqual(await leader, {"answer": "shared"})
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+        self.assertEqual(self.agent._inflight, {})
+    
+    async def test_cancelled_first_caller_releases_waiters(self):
+        """Test that waiters fail instead of hanging when the first caller is cancelled."""
+        async def hanging_call_tool(server_name, tool_name, arguments):
+            await asyncio.Event().wait()
+        
+        self.mock_mcp_client.call_tool = hanging_call_tool
+        
+        leader = asyncio.create_task(self.agent._call_tool_coalesced("adk_query", {"query": "q"}))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(self.agent._call_tool_coalesced("adk_query", {"query": "q"}))
+        await asyncio.sleep(0)
+        leader.cancel()
+        
+        with self.assertRaises(RuntimeError):
+            await asyncio.wait_for(waiter, timeout=1)
+        with self.assertRaises(asyncio.CancelledError):
+            await leader
+        self.assertEqual(self.agent._inflight, {})
+    
+    async def test_provide_assistance_with_structured_project_structure(self):
+        """Test that a context whose projectStructure holds dicts is still answered."""
+        context = {"projectStructure": [{"path": "src", "children": ["main.rs"]}]}
+        
+        result = await self.agent.provide_assistance("How do I set up a project?", context)
+        
+        self.assertIsInstance(result.primary_guidance, ProjectSetupGuidance)
+        self.assertEqual(hash(ProjectContext.from_dict(context)), hash(ProjectContext.from_dict(context)))
+        self.assertEqual(
+            list(self.agent._result_cache),
+            [(AssistanceType.PROJECT_SETUP, "How do I set up a project?", ProjectContext.from_dict(context).raw)]
+        )
+    
+    async def test_provide_assistance_uses_result_cache(self):
+        """Test that repeated identical requests are served from the result cache."""
+        calls = []
+        original_call_tool = self.mock_mcp_client.call_tool
+        
+        async def counting_call_tool(server_name, tool_name, arguments):
+            calls.append(tool_name)
+            return await original_call_tool(server_name, tool_name, arguments)
+        
+        self.mock_mcp_client.call_tool = counting_call_tool
+        
+        first = await self.agent.provide_assistance(
+            "Help with project setup", self.sample_context, AssistanceType.PROJECT_SETUP
+        )
+        calls_after_first = len(calls)
+        second = await self.agent.provide_assistance(
+            "Help with project setup", self.sample_context.to_dict(), AssistanceType.PROJECT_SETUP
+        )
+        
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(len(calls), calls_after_first)
+        
+        # Mutating a returned result must not leak into later cache hits
+        second.follow_up_suggestions.append("caller note")
+        second.primary_guidance.prerequisites.clear()
+        third = await self.agent.provide_assistance(
+            "Help with project setup", self.sample_context, AssistanceType.PROJECT_SETUP
+        )
+        self.assertEqual(third, first)
+        
+        await self.agent.provide_assistance(
+            "Help with project setup", self.sample_context, AssistanceType.TASK_BREAKDOWN
+        )
+        self.assertGreater(len(calls), calls_after_first)
+        self.assertEqual(len(self.agent._result_cache), 2)
     
     async def test_mcp_tool_failure_handling(self):
         """Test handling of MCP tool failures."""
         # Mock a failing MCP client
-        async def failing_call_tool(server_name, tool_name, arguments):
-            raise Exception("MCP tool failed")
-        
-        self.mock_mcp_client.call_tool = failing_call_tool
+        self.mock_mcp_client.call_tool = AsyncMock(side_effect=Exception("MCP tool failed"))
         
         result = await self.agent.provide_assistance(
             "Help with project setup",
@@ -548,6 +747,7 @@ class TestDataClasses(unittest.TestCase):
         self.assertEqual(len(result.additional_resources), 1)
 
 
+@_slow
 class TestFormatting(unittest.TestCase):
     """Test result formatting functions."""
     
@@ -574,6 +774,25 @@ class TestFormatting(unittest.TestCase):
         self.assertIn("Follow-up Suggestions", formatted)
         self.assertIn("References", formatted)
     
+    def test_format_result_bullet_sections(self):
+        """Test numbered follow-ups, linked references and skipped empty sections."""
+        result = ProjectAssistanceResult(
+            assistance_type=AssistanceType.GENERAL_GUIDANCE,
+            summary="Summary",
+            primary_guidance="Guidance",
+            additional_resources=[],
+            best_practices=["Practice 1"],
+            references=["https://example.com/adk", "ADK Guide"],
+            follow_up_suggestions=["First", "Second"]
+        )
+        
+        formatted = format_project_assistance_result(result)
+        
+        self.assertNotIn("## Additional Resources", formatted)
+        self.assertIn("1. First\n2. Second", formatted)
+        self.assertIn("- [https://example.com/adk](https://example.com/adk)", formatted)
+        self.assertIn("- ADK Guide", formatted)
+    
     def test_format_project_setup_guidance(self):
         """Test project setup guidance formatting."""
         from adk_project_assistant_agent import _format_project_setup_guidance
@@ -619,10 +838,10 @@ class TestFormatting(unittest.TestCase):
         
         formatted = _format_code_examples(examples)
         
-        self.assertIn("Example 1: Test Example", formatted[0])
-        self.assertIn("A test example", formatted[2])
-        self.assertIn("```rust", formatted[4])
-        self.assertIn("fn main()", formatted[5])
+        # Heading, description and code block are emitted as a single entry
+        self.assertTrue(formatted[0].startswith("### Example 1: Test Example\n\nA test example\n"))
+        self.assertIn("```rust\nfn main()", formatted[0])
+        self.assertIn("- Use proper formatting", formatted[2])
         # Find the explanation line dynamically
         explanation_found = False
         for line in formatted:
@@ -632,22 +851,29 @@ class TestFormatting(unittest.TestCase):
         self.assertTrue(explanation_found, "Explanation 'Simple hello world' not found in formatted output")
 
 
+@_slow
 class TestConfiguration(unittest.TestCase):
     """Test configuration file validation."""
     
-    def test_agent_configuration_file_exists(self):
-        """Test that the agent configuration file exists and is valid."""
-        config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'adk_project_assistant_agent.json')
+    @classmethod
+    def setUpClass(cls):
+        """Locate and parse the agent configuration file once for every test."""
+        cls.config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'adk_project_assistant_agent.json')
         
         # Check if running from test directory
-        if not os.path.exists(config_path):
-            config_path = os.path.join(os.path.dirname(__file__), 'adk_project_assistant_agent.json')
-        
-        self.assertTrue(os.path.exists(config_path), 
-                       f"Configuration file not found at {config_path}")
+        if not os.path.exists(cls.config_path):
+            cls.config_path = os.path.join(os.path.dirname(__file__), 'adk_project_assistant_agent.json')
         
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        cls.config = None
+        if os.path.exists(cls.config_path):
+            with open(cls.config_path, 'r') as f:
+                cls.config = json.load(f)
+    
+    def test_agent_configuration_file_exists(self):
+        """Test that the agent configuration file exists and is valid."""
+        self.assertIsNotNone(self.config, 
+                             f"Configuration file not found at {self.config_path}")
+        config = self.config
         
         # Validate required configuration fields
         self.assertIn('name', config)
@@ -679,21 +905,8 @@ class TestConfiguration(unittest.TestCase):
 
 def run_tests():
     """Run all tests with detailed output."""
-    # Create test suite
-    test_suite = unittest.TestSuite()
-    
-    # Add test cases
-    test_classes = [
-        TestADKProjectAssistantAgent,
-        TestADKProjectAssistantAgentAsync,
-        TestDataClasses,
-        TestFormatting,
-        TestConfiguration
-    ]
-    
-    for test_class in test_classes:
-        tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        test_suite.addTests(tests)
+    # Every TestCase class in this module
+    test_suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
     
     # Run tests with verbose output
     runner = unittest.TextTestRunner(verbosity=2, buffer=True)
@@ -705,7 +918,8 @@ def run_tests():
     print(f"Tests run: {result.testsRun}")
     print(f"Failures: {len(result.failures)}")
     print(f"Errors: {len(result.errors)}")
-    print(f"Success rate: {((result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun * 100):.1f}%")
+    print(f"Skipped: {len(result.skipped)}")
+    print(f"Success rate: {((result.testsRun - len(result.failures) - len(result.errors)) / max(1, result.testsRun) * 100):.1f}%")
     print(f"{'='*60}")
     
     return result.wasSuccessful()